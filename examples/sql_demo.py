@@ -13,14 +13,64 @@ Requirements:
 """
 
 import asyncio
+import itertools
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from witskit.storage.sql_writer import SQLWriter, DatabaseConfig
-from witskit.decoder.wits_decoder import decode_frame
+from witskit.storage.sql_writer import (
+    SQLWriter,
+    DatabaseConfig,
+    SQLITE_INGEST_PRAGMAS,
+)
+from witskit.decoder.wits_decoder import WITSDecoder, decode_frame
 from witskit.transport.file_reader import FileReader
 
+# Frames per store_frames() call; larger batches amortize commit overhead
+BATCH_SIZE = 1000
+
+try:
+    import orjson
+
+    def dump_json(obj, path: str) -> None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+except ImportError:
+
+    def dump_json(obj, path: str) -> None:
+        Path(path).write_text(json.dumps(obj, indent=2))
+
+
+async def store_file(
+    sql_writer: SQLWriter,
+    file_reader: FileReader,
+    source: str,
+    use_metric_units: bool,
+) -> int:
+    """
+    Decode a file's frames and store them in batches of BATCH_SIZE.
+
+    See sql_storage_example.py for a version that overlaps decoding
+    with storing.
+
+    Returns:
+        Number of frames decoded and stored
+    """
+    frames = file_reader.stream()
+    decoder = WITSDecoder(use_metric_units=use_metric_units)
+    stored = 0
+    while raw_batch := list(itertools.islice(frames, BATCH_SIZE)):
+        batch = []
+        for frame_data in raw_batch:
+            try:
+                batch.append(decoder.decode_frame(frame_data, source=source))
+            except Exception as e:
+                print(f"  Error processing frame: {e}")
+        if batch:
+            await sql_writer.store_frames(batch)
+            stored += len(batch)
+    return stored
+
 
 async def demo_comprehensive_sql():
     """Comprehensive demo of SQL storage capabilities."""
@@ -30,7 +80,7 @@ async def demo_comprehensive_sql():
 
     # Create database
     db_path = "comprehensive_demo.db"
-    config = DatabaseConfig.sqlite(db_path, echo=False)
+    config = DatabaseConfig.sqlite(db_path, echo=False, pragmas=SQLITE_INGEST_PRAGMAS)
     sql_writer = SQLWriter(config)
 
     try:
@@ -66,6 +116,7 @@ async def demo_comprehensive_sql():
         print(f"\nStoring data from {len(sources_data)} different sources...")
 
         all_frames = []
+        base_time = datetime.now()
         for source_info in sources_data:
             source = source_info["source"]
             print(f"  Processing {len(source_info['frames'])} frames from {source}")
@@ -74,16 +125,11 @@ async def demo_comprehensive_sql():
                 # Add slight time offset to simulate real streaming
                 frame = decode_frame(frame_data, source=source, use_metric_units=False)
                 # Adjust timestamp to simulate time progression
-                frame.frame.timestamp = datetime.now() + timedelta(seconds=i)
+                frame.frame.timestamp = base_time + timedelta(seconds=i)
                 all_frames.append(frame)
 
-        # Store all frames in batches
-        batch_size = 3
-        for i in range(0, len(all_frames), batch_size):
-            batch = all_frames[i : i + batch_size]
-            await sql_writer.store_frames(batch)
-            print(f"  💾 Stored batch {i//batch_size + 1}: {len(batch)} frames")
-
+        # Store all frames in a single batch (one commit for every source)
+        await sql_writer.store_frames(all_frames)
         print(f"Stored {len(all_frames)} total frames")
 
         # Query and analyze the data
@@ -107,27 +153,21 @@ async def demo_comprehensive_sql():
 
         # 3. Query specific drilling parameters
         print("\nDepth Analysis (Symbol 0108):")
-        depth_data = []
-        async for dp in sql_writer.query_data_points(symbol_codes=["0108"], limit=20):
-            depth_data.append(dp)
-
-        if depth_data:
-            depths = [
-                dp.parsed_value for dp in depth_data if dp.parsed_value is not None
-            ]
-            min_depth = min(depths)
-            max_depth = max(depths)
-            print(f"  📏 Depth range: {min_depth} - {max_depth} feet")
+        depth_data = await sql_writer.query_data_points_all(
+            symbol_codes=["0108"], limit=20
+        )
+
+        depths = [dp.parsed_value for dp in depth_data if dp.parsed_value is not None]
+        if depths:
+            print(f"  📏 Depth range: {min(depths)} - {max(depths)} feet")
             print(f"  Data points: {len(depth_data)}")
 
         # 4. Time-based query (last 30 seconds)
         print("\n⏰ Recent Data (last 30 seconds):")
         recent_time = datetime.now() - timedelta(seconds=30)
-        recent_data = []
-        async for dp in sql_writer.query_data_points(
+        recent_data = await sql_writer.query_data_points_all(
             symbol_codes=["0108", "0113", "0114"], start_time=recent_time, limit=50
-        ):
-            recent_data.append(dp)
+        )
 
         print(f"  Found {len(recent_data)} recent measurements")
 
@@ -147,8 +187,7 @@ async def demo_comprehensive_sql():
             )
 
         if export_data:
-            with open("depth_export.json", "w") as f:
-                json.dump(export_data, f, indent=2)
+            dump_json(export_data, "depth_export.json")
             print(
                 f"  Exported {len(export_data)} depth measurements to depth_export.json"
             )
@@ -204,42 +243,27 @@ async def demo_file_integration():
         return
 
     db_path = "file_integration_demo.db"
-    config = DatabaseConfig.sqlite(db_path, echo=False)
+    config = DatabaseConfig.sqlite(db_path, echo=False, pragmas=SQLITE_INGEST_PRAGMAS)
     sql_writer = SQLWriter(config)
 
     try:
         await sql_writer.initialize()
         print("Processing sample files...")
 
+        # One reader, repointed at each file in turn
+        file_reader = FileReader(available_files[0])
         for file_path in available_files:
             print(f"  Processing {file_path}...")
 
-            file_reader = FileReader(file_path)
-            frames_processed = 0
-            batch = []
-
-            for frame_data in file_reader.stream():
-                try:
-                    frame = decode_frame(
-                        frame_data, source=f"file://{file_path}", use_metric_units=False
-                    )
-                    batch.append(frame)
-                    frames_processed += 1
-
-                    # Process in batches
-                    if len(batch) >= 5:
-                        await sql_writer.store_frames(batch)
-                        batch.clear()
-
-                except Exception as e:
-                    print(f"    Error processing frame: {e}")
-
-            # Store remaining batch
-            if batch:
-                await sql_writer.store_frames(batch)
-
-            file_reader.close()
+            file_reader.reset(file_path)
+            frames_processed = await store_file(
+                sql_writer,
+                file_reader,
+                source=f"file://{file_path}",
+                use_metric_units=False,
+            )
             print(f"    Processed {frames_processed} frames")
+        file_reader.close()
 
         # Query the combined data
         symbols = await sql_writer.get_available_symbols()
@@ -13,13 +13,75 @@ Requirements:
 """
 
 import asyncio
+import itertools
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from witskit.storage.sql_writer import SQLWriter, DatabaseConfig
-from witskit.decoder.wits_decoder import decode_frame
+from witskit.storage.sql_writer import (
+    SQLWriter,
+    DatabaseConfig,
+    SQLITE_INGEST_PRAGMAS,
+)
+from witskit.decoder.wits_decoder import WITSDecoder, decode_frame
 from witskit.transport.file_reader import FileReader
 
+# Frames per store_frames() call; larger batches amortize commit overhead
+BATCH_SIZE = 1000
+
+
+async def store_file_pipelined(
+    sql_writer: SQLWriter,
+    file_reader: FileReader,
+    source: str,
+    use_metric_units: bool,
+) -> int:
+    """
+    Decode frames in a worker thread while the previous batch is being stored.
+
+    Decoding is CPU-bound and storing is IO-bound, so running them as a
+    producer/consumer pair keeps both busy.
+
+    Returns:
+        Number of frames decoded and stored
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    frames = file_reader.stream()
+    decoder = WITSDecoder(use_metric_units=use_metric_units)
+
+    def decode_batch() -> tuple[list, bool]:
+        batch = []
+        read = 0
+        for frame_data in itertools.islice(frames, BATCH_SIZE):
+            read += 1
+            try:
+                batch.append(decoder.decode_frame(frame_data, source=source))
+            except Exception as e:
+                print(f"  Error processing frame: {e}")
+        return batch, read < BATCH_SIZE
+
+    async def producer() -> None:
+        exhausted = False
+        while not exhausted:
+            batch, exhausted = await asyncio.to_thread(decode_batch)
+            if batch:
+                await queue.put(batch)
+        await queue.put(None)
+
+    async def consumer() -> int:
+        stored = 0
+        while (batch := await queue.get()) is not None:
+            await sql_writer.store_frames(batch)
+            stored += len(batch)
+            print(f"  Stored batch of {len(batch)} frames")
+        return stored
+
+    # If either side fails the task group cancels the other, so the
+    # producer is never left blocked on a full queue
+    async with asyncio.TaskGroup() as group:
+        group.create_task(producer())
+        storing = group.create_task(consumer())
+    return storing.result()
+
 
 async def demo_sql_storage():
     """Demonstrate SQL storage functionality."""
@@ -29,7 +91,7 @@ async def demo_sql_storage():
 
     # 1. Create database configuration (SQLite for simplicity)
     db_path = "demo_drilling_data.db"
-    config = DatabaseConfig.sqlite(db_path, echo=True)
+    config = DatabaseConfig.sqlite(db_path, echo=True, pragmas=SQLITE_INGEST_PRAGMAS)
 
     print(f"Creating SQLite database: {db_path}")
 
@@ -91,11 +153,9 @@ async def demo_sql_storage():
 
         # Query specific symbols
         print("\nQuerying depth and temperature data...")
-        depth_data = []
-        async for data_point in sql_writer.query_data_points(
+        depth_data = await sql_writer.query_data_points_all(
             symbol_codes=["0108"], limit=10  # Depth symbol
-        ):
-            depth_data.append(data_point)
+        )
 
         print(f"Found {len(depth_data)} depth measurements:")
         for dp in depth_data:
@@ -106,11 +166,9 @@ async def demo_sql_storage():
 
         # Get data from the last minute
         one_minute_ago = datetime.now() - timedelta(minutes=1)
-        recent_data = []
-        async for data_point in sql_writer.query_data_points(
+        recent_data = await sql_writer.query_data_points_all(
             symbol_codes=["0108", "0113"], start_time=one_minute_ago, limit=20
-        ):
-            recent_data.append(data_point)
+        )
 
         print(f"Data points from last minute: {len(recent_data)}")
 
@@ -151,7 +209,7 @@ async def demo_file_streaming():
 
     # Create database
     db_path = "file_streaming_demo.db"
-    config = DatabaseConfig.sqlite(db_path)
+    config = DatabaseConfig.sqlite(db_path, pragmas=SQLITE_INGEST_PRAGMAS)
     sql_writer = SQLWriter(config)
     await sql_writer.initialize()
 
@@ -160,31 +218,12 @@ async def demo_file_streaming():
 
         # Stream from file
         file_reader = FileReader(str(sample_file))
-        frames_processed = 0
-        batch = []
-
-        for frame_data in file_reader.stream():
-            try:
-                decoded_frame = decode_frame(
-                    frame_data, source=f"file://{sample_file}", use_metric_units=True
-                )
-                batch.append(decoded_frame)
-                frames_processed += 1
-
-                # Process in batches of 10
-                if len(batch) >= 10:
-                    await sql_writer.store_frames(batch)
-                    print(f"  Stored batch of {len(batch)} frames")
-                    batch.clear()
-
-            except Exception as e:
-                print(f"  Error processing frame {frames_processed + 1}: {e}")
-
-        # Store remaining batch
-        if batch:
-            await sql_writer.store_frames(batch)
-            print(f"  Stored final batch of {len(batch)} frames")
-
+        frames_processed = await store_file_pipelined(
+            sql_writer,
+            file_reader,
+            source=f"file://{sample_file}",
+            use_metric_units=True,
+        )
         file_reader.close()
 
         print(f"Processed {frames_processed} frames from file")
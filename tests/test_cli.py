@@ -0,0 +1,157 @@
+"""
+Tests for the witskit command line interface.
+"""
+
+import csv
+import io
+import json
+import socket
+
+from typer.testing import CliRunner
+
+from witskit.cli import app
+from witskit.models.symbols import (
+    WITS_SYMBOLS,
+    get_record_types,
+    get_symbols_by_record_type,
+)
+
+runner = CliRunner()
+
+ONE_FRAME = "&&\n01083650.40\n011323.38\n!!"
+
+TWO_FRAMES = """&&
+01083650.40
+011323.38
+!!
+&&
+01083651.20
+011324.10
+!!
+"""
+
+
+def read_csv(output):
+    """Parse CLI output as CSV rows."""
+    return list(csv.reader(io.StringIO(output)))
+
+
+class TestDecodeJSON:
+    """Test the JSON output of the decode command."""
+
+    def test_multi_frame_data_is_a_list_of_points(self, tmp_path) -> None:
+        """Every point of every frame is kept, in decode order."""
+        path = tmp_path / "two.wits"
+        path.write_text(TWO_FRAMES)
+
+        result = runner.invoke(app, ["decode", str(path), "--format", "json"])
+        assert result.exit_code == 0, result.output
+
+        payload = json.loads(result.stdout)
+        assert payload["frames"] == 2
+        assert isinstance(payload["data"], list)
+        assert [row["code"] for row in payload["data"]] == [
+            "0108",
+            "0113",
+            "0108",
+            "0113",
+        ]
+        assert [row["raw_value"] for row in payload["data"]] == [
+            "3650.40",
+            "23.38",
+            "3651.20",
+            "24.10",
+        ]
+        assert set(payload["data"][0]) == {
+            "code",
+            "name",
+            "description",
+            "value",
+            "raw_value",
+            "unit",
+        }
+        assert payload["errors"] == []
+
+
+class TestPipedCSV:
+    """Test the CSV written instead of Rich tables when stdout is not a terminal."""
+
+    def test_decode_table_writes_csv(self) -> None:
+        """decode --format table emits a header and one row per data point."""
+        result = runner.invoke(app, ["decode", ONE_FRAME, "--format", "table"])
+        assert result.exit_code == 0, result.output
+
+        rows = read_csv(result.stdout)
+        assert rows[0] == ["Symbol", "Name", "Value", "Unit", "Description"]
+        assert [row[0] for row in rows[1:]] == ["0108", "0113"]
+        assert rows[1][1:4] == ["DBTM", "3650.4", WITS_SYMBOLS["0108"].fps_units.value]
+        # Descriptions are written in full, not truncated for display
+        assert rows[1][4] == WITS_SYMBOLS["0108"].description
+
+    def test_symbols_writes_csv(self) -> None:
+        """symbols --record emits every symbol of the record in code order."""
+        result = runner.invoke(app, ["symbols", "--record", "1"])
+        assert result.exit_code == 0, result.output
+
+        rows = read_csv(result.stdout)
+        expected = get_symbols_by_record_type(1)
+        assert rows[0] == [
+            "Code",
+            "Rec",
+            "Name",
+            "Type",
+            "Metric",
+            "FPS",
+            "Description",
+        ]
+        assert [row[0] for row in rows[1:]] == sorted(expected)
+        assert all(row[1] == "1" for row in rows[1:])
+        assert {row[0]: row[6] for row in rows[1:]} == {
+            code: symbol.description for code, symbol in expected.items()
+        }
+
+    def test_list_records_writes_csv(self) -> None:
+        """symbols --list-records emits one row per record type with its symbol count."""
+        result = runner.invoke(app, ["symbols", "--list-records"])
+        assert result.exit_code == 0, result.output
+
+        rows = read_csv(result.stdout)
+        assert rows[0] == ["Record", "Description", "Symbols", "Category"]
+        record_types = get_record_types()
+        assert len(rows) - 1 == len(record_types)
+        assert [int(row[0]) for row in rows[1:]] == record_types
+        assert sum(int(row[2]) for row in rows[1:]) == len(WITS_SYMBOLS)
+
+
+class TestStreamOutput:
+    """Test the --output file of the stream command."""
+
+    def test_refused_connection_leaves_no_file(self, tmp_path) -> None:
+        """No output file is created when the source fails before any frame."""
+        # Bind and release a port so nothing is listening on it
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        output = tmp_path / "out.json"
+
+        result = runner.invoke(
+            app, ["stream", f"tcp://127.0.0.1:{port}", "--output", str(output)]
+        )
+
+        assert result.exit_code == 1
+        assert not output.exists()
+
+    def test_file_stream_writes_every_frame(self, tmp_path) -> None:
+        """Frames streamed from a file are all saved to the output document."""
+        path = tmp_path / "two.wits"
+        path.write_text(TWO_FRAMES)
+        output = tmp_path / "out.json"
+
+        result = runner.invoke(
+            app, ["stream", f"file://{path}", "--output", str(output)]
+        )
+
+        assert result.exit_code == 0, result.output
+        saved = json.loads(output.read_text())
+        assert saved["frames"] == 2
+        assert [record["frame"] for record in saved["data"]] == [1, 2]
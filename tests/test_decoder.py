@@ -12,9 +12,17 @@ from witskit.models.symbols import (
     WITSDataType,
     WITSUnits,
     get_symbol_by_code,
+    search_symbols,
 )
 from witskit.models.wits_frame import WITSFrame, DecodedData, DecodedFrame
-from witskit.decoder.wits_decoder import WITSDecoder, decode_frame, validate_wits_frame
+from witskit.decoder.wits_decoder import (
+    WITSDecoder,
+    decode_file,
+    decode_frame,
+    split_multiple_frames,
+    validate_wits_frame,
+    _WELL_FORMED_FRAME,
+)
 
 
 class TestWITSFrame:
@@ -152,6 +160,48 @@ class TestWITSDecoder:
             # This is also acceptable in strict mode
             pass
 
+    def test_irregular_frames_match_regular_frames(self) -> None:
+        """Test CRLF, padded and blank-line frames decode like clean frames."""
+        decoder = WITSDecoder()
+        clean = decoder.decode_frame("&&\n01083650.40\n011323.38\n!!")
+        variants = [
+            "&&\r\n01083650.40\r\n011323.38\r\n!!\r\n",
+            "&&\n  0108 3650.40  \n011323.38\n!!",
+            "&&\n01083650.40\n\n011323.38\n!!",
+        ]
+
+        expected = [(dp.symbol_code, dp.raw_value) for dp in clean.data_points]
+        for raw in variants:
+            result = decoder.decode_frame(raw)
+            assert [(dp.symbol_code, dp.raw_value) for dp in result.data_points] == expected
+            assert result.errors == []
+
+    def test_decode_frame_accepts_bytes(self) -> None:
+        """Test raw frame bytes decode the same as the equivalent string."""
+        decoder = WITSDecoder()
+        text = "&&\n01083650.40\n011323.38\n!!"
+
+        from_str = decoder.decode_frame(text)
+        from_bytes = decoder.decode_frame(text.encode())
+
+        assert [(dp.symbol_code, dp.parsed_value) for dp in from_bytes.data_points] == [
+            (dp.symbol_code, dp.parsed_value) for dp in from_str.data_points
+        ]
+        assert from_bytes.frame.raw_data == text
+
+    def test_decode_file_with_presplit_frames(self) -> None:
+        """Test decode_file uses frames the caller already split."""
+        data = "&&\n01083650.40\n!!\n&&\n01083651.20\n!!"
+        frames = split_multiple_frames(data)
+
+        results = decode_file(data, frames=frames)
+
+        assert [r.data_points[0].parsed_value for r in results] == [3650.40, 3651.20]
+        assert [r.data_points[0].parsed_value for r in decode_file(data)] == [
+            3650.40,
+            3651.20,
+        ]
+
     def test_convenience_functions(self) -> None:
         """Test convenience functions."""
         frame = """&&
@@ -167,6 +217,35 @@ class TestWITSDecoder:
         assert validate_wits_frame(frame) is True
         assert validate_wits_frame("invalid") is False
 
+    @pytest.mark.parametrize("strict", [False, True])
+    def test_fast_and_general_paths_agree_on_bad_lines(self, strict) -> None:
+        """A bad line is reported the same with and without the regex fast path."""
+        # A non-numeric value for a float symbol and an unknown symbol code;
+        # the blank line keeps the second frame off the fast path.
+        fast = "&&\n01083650.40\n0113abc\n99991.0\n!!"
+        general = "&&\n01083650.40\n\n0113abc\n99991.0\n!!"
+        assert _WELL_FORMED_FRAME.fullmatch(fast)
+        assert not _WELL_FORMED_FRAME.fullmatch(general)
+        decoder = WITSDecoder(strict_mode=strict)
+
+        if strict:
+            with pytest.raises(ValueError) as fast_error:
+                decoder.decode_frame(fast)
+            with pytest.raises(ValueError) as general_error:
+                decoder.decode_frame(general)
+            assert str(fast_error.value) == str(general_error.value)
+            assert "Unknown symbol code: 9999" in str(fast_error.value)
+            return
+
+        fast_result = decoder.decode_frame(fast)
+        general_result = decoder.decode_frame(general)
+        assert fast_result.errors == general_result.errors
+        assert [(dp.symbol_code, dp.parsed_value) for dp in fast_result.data_points] == [
+            (dp.symbol_code, dp.parsed_value) for dp in general_result.data_points
+        ]
+        # The unparseable value is kept as its raw string, not dropped
+        assert fast_result.data_points[1].parsed_value == "abc"
+
 
 class TestSymbolLookup:
     """Test symbol lookup functionality."""
@@ -184,6 +263,19 @@ class TestSymbolLookup:
         unknown: WITSSymbol | None = get_symbol_by_code("9999")
         assert unknown is None
 
+    def test_search_symbols(self) -> None:
+        """Test case-insensitive symbol search with optional record filter."""
+        results = search_symbols("DEPTH BIT")
+        assert "0108" in results
+
+        # Codes are searchable too
+        assert "0108" in search_symbols("0108")
+
+        # Record filter restricts matches to a single record type
+        record_1 = search_symbols("depth", record_type=1)
+        assert record_1
+        assert all(symbol.record_type == 1 for symbol in record_1.values())
+
 
 def test_integration() -> None:
     """Integration test with realistic WITS data."""
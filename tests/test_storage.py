@@ -0,0 +1,210 @@
+"""
+Tests for SQL storage of decoded WITS data.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import select, text
+
+from witskit.decoder.wits_decoder import decode_frame
+from witskit.storage.sql_writer import (
+    SQLITE_INGEST_PRAGMAS,
+    DatabaseConfig,
+    SQLWriter,
+)
+from witskit.storage.schema import WITSFrame, WITSDataPoint
+
+FRAME_A = """&&
+01083650.40
+011323.38
+011412.5
+!!"""
+
+FRAME_B = """&&
+01083651.20
+011324.10
+!!"""
+
+
+def run_with_writer(config, body):
+    """Initialize a writer for config, run body(writer) and close it."""
+
+    async def main():
+        writer = SQLWriter(config)
+        await writer.initialize()
+        try:
+            return await body(writer)
+        finally:
+            await writer.close()
+
+    return asyncio.run(main())
+
+
+class TestStoreFrames:
+    """Test batched frame storage."""
+
+    def test_round_trip_keeps_points_with_their_frame(self) -> None:
+        """Each stored point points back at the frame it was decoded from."""
+        frames = [
+            decode_frame(FRAME_A, source="rig-a"),
+            decode_frame(FRAME_B, source="rig-b"),
+        ]
+
+        async def body(writer):
+            await writer.store_frames(frames)
+            async with writer.get_session() as session:
+                stored = (await session.execute(select(WITSFrame))).scalars().all()
+                points = (
+                    (await session.execute(select(WITSDataPoint))).scalars().all()
+                )
+            return stored, points
+
+        stored, points = run_with_writer(DatabaseConfig.sqlite(":memory:"), body)
+
+        assert len(stored) == 2
+        assert len(points) == sum(len(f.data_points) for f in frames)
+
+        ids_by_raw = {frame.raw_data: frame.id for frame in stored}
+        for decoded in frames:
+            frame_id = ids_by_raw[decoded.frame.raw_data]
+            frame_points = [p for p in points if p.frame_id == frame_id]
+            assert len(frame_points) == len(decoded.data_points)
+            assert [p.symbol_code for p in frame_points] == [
+                dp.symbol_code for dp in decoded.data_points
+            ]
+            assert {p.source for p in frame_points} == {decoded.source}
+
+
+def read_pragmas(config):
+    """Return (journal_mode, synchronous, pragma listener installed) for config."""
+
+    async def body(writer):
+        async with writer.get_session() as session:
+            journal_mode = (await session.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await session.execute(text("PRAGMA synchronous"))).scalar()
+        listeners = writer.engine.sync_engine.pool.dispatch.connect
+        installed = any(
+            getattr(fn, "__name__", "") == "_set_sqlite_pragmas" for fn in listeners
+        )
+        return journal_mode.lower(), synchronous, installed
+
+    return run_with_writer(config, body)
+
+
+class TestSQLitePragmas:
+    """Test the per-connection SQLite PRAGMAs."""
+
+    def test_ingest_pragmas_applied_on_connect(self, tmp_path) -> None:
+        """SQLITE_INGEST_PRAGMAS switch a file database to WAL/NORMAL."""
+        config = DatabaseConfig.sqlite(
+            str(tmp_path / "ingest.db"), pragmas=SQLITE_INGEST_PRAGMAS
+        )
+        journal_mode, synchronous, installed = read_pragmas(config)
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert installed
+
+    def test_empty_pragmas_keep_sqlite_defaults(self, tmp_path) -> None:
+        """An empty mapping installs no listener and leaves the defaults alone."""
+        config = DatabaseConfig.sqlite(str(tmp_path / "plain.db"), pragmas={})
+        journal_mode, synchronous, installed = read_pragmas(config)
+        assert journal_mode == "delete"
+        assert synchronous == 2  # FULL
+        assert not installed
+
+    def test_override_replaces_ingest_pragmas(self, tmp_path) -> None:
+        """Passed PRAGMAs replace the ingest set rather than merging into it."""
+        config = DatabaseConfig.sqlite(
+            str(tmp_path / "override.db"), pragmas={"synchronous": "OFF"}
+        )
+        journal_mode, synchronous, _ = read_pragmas(config)
+        assert journal_mode == "delete"
+        assert synchronous == 0  # OFF
+
+    def test_non_sqlite_config_gets_no_listener(self, tmp_path) -> None:
+        """PRAGMAs are only installed for database_type == "sqlite"."""
+        # Point a non-SQLite config at a SQLite URL so the test needs no server
+        config = DatabaseConfig(
+            database_type="postgresql",
+            database_url=f"sqlite+aiosqlite:///{tmp_path / 'other.db'}",
+            sqlite_pragmas=SQLITE_INGEST_PRAGMAS,
+        )
+        journal_mode, _, installed = read_pragmas(config)
+        assert journal_mode == "delete"
+        assert not installed
+
+
+def decode_at(raw_frame, source, timestamp):
+    """Decode raw_frame and pin the frame and its points to timestamp."""
+    decoded = decode_frame(raw_frame, source=source)
+    decoded.frame.timestamp = timestamp
+    for data_point in decoded.data_points:
+        data_point.timestamp = timestamp
+    return decoded
+
+
+class TestQueryDataPoints:
+    """Test the streaming and list variants of the data point query."""
+
+    T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+    def query_both(self, **filters):
+        """Run both query variants over the same stored frames."""
+        frames = [
+            decode_at(FRAME_A, "rig-a", self.T0),
+            decode_at(FRAME_B, "rig-b", self.T0 + timedelta(minutes=1)),
+            decode_at(FRAME_A, "rig-a", self.T0 + timedelta(minutes=2)),
+        ]
+
+        def key(data_point):
+            return (
+                data_point.symbol_code,
+                data_point.timestamp,
+                data_point.source,
+                data_point.raw_value,
+            )
+
+        async def body(writer):
+            await writer.store_frames(frames)
+            streamed = [key(dp) async for dp in writer.query_data_points(**filters)]
+            listed = [key(dp) for dp in await writer.query_data_points_all(**filters)]
+            return streamed, listed
+
+        return run_with_writer(DatabaseConfig.sqlite(":memory:"), body)
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            ({"symbol_codes": ["0108"]}, 3),
+            ({"symbol_codes": ["0108", "0113"]}, 6),
+            ({"symbol_codes": ["0114"]}, 2),
+            ({"symbol_codes": ["0108"], "source": "rig-b"}, 1),
+            (
+                {
+                    "symbol_codes": ["0108", "0113"],
+                    "start_time": T0 + timedelta(minutes=1),
+                    "end_time": T0 + timedelta(minutes=2),
+                },
+                4,
+            ),
+            ({"symbol_codes": ["0108", "0113"], "limit": 3}, 3),
+        ],
+    )
+    def test_variants_apply_the_same_filters(self, filters, expected) -> None:
+        """Both variants return the same rows in the same order."""
+        streamed, listed = self.query_both(**filters)
+        assert streamed == listed
+        assert len(listed) == expected
+
+    def test_limit_keeps_the_earliest_rows(self) -> None:
+        """A limit truncates the timestamp-ordered result; None returns it all."""
+        limited, _ = self.query_both(symbol_codes=["0108"], limit=2)
+        unlimited, _ = self.query_both(symbol_codes=["0108"], limit=None)
+        assert len(unlimited) == 3
+        assert limited == unlimited[:2]
+        assert [row[1] for row in unlimited] == sorted(row[1] for row in unlimited)
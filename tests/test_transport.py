@@ -3,13 +3,20 @@ Unit tests for transport layer components.
 """
 
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import AsyncMock, Mock, patch, mock_open
 from io import StringIO
+import asyncio
+import faulthandler
 import socket
+import struct
+import threading
+import time
 from typing import Generator, NoReturn, Optional
 
-from witskit.transport.base import BaseTransport
+from witskit.transport.base import MAX_FRAME_SIZE, BaseTransport, scan_frames
 from witskit.transport.tcp_reader import TCPReader
+from witskit.transport.requesting_tcp_reader import RequestingTCPReader
+from witskit.transport.async_tcp_reader import AsyncTCPReader
 from witskit.transport.serial_reader import SerialReader
 from witskit.transport.file_reader import FileReader
 
@@ -31,6 +38,55 @@ class MockTransport(BaseTransport):
         self.closed = True
 
 
+def serve_once(
+    chunks: list[bytes],
+    hold_open: float = 0.0,
+    read_request: bool = True,
+    reset: bool = False,
+) -> tuple[int, list[bytes]]:
+    """Start a one-shot loopback server that records the request and sends chunks.
+
+    Args:
+        chunks: Data sent to the client, one sendall() per chunk
+        hold_open: Seconds to keep the connection open after sending
+        read_request: Wait for the client to send something first
+        reset: End with a TCP RST instead of an orderly close
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(5.0)
+    requests: list[bytes] = []
+
+    def handle() -> None:
+        with server:
+            conn, _ = server.accept()
+            # Never wait on the client for longer than the test would
+            conn.settimeout(5.0)
+            with conn:
+                if read_request:
+                    requests.append(conn.recv(64))
+                for chunk in chunks:
+                    conn.sendall(chunk)
+                    time.sleep(0.01)
+                time.sleep(hold_open)
+                if reset:
+                    conn.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+
+    threading.Thread(target=handle, daemon=True).start()
+    return server.getsockname()[1], requests
+
+
+@pytest.fixture(autouse=True)
+def hang_guard() -> Generator[None, None, None]:
+    """Abort the run with tracebacks if a socket test deadlocks."""
+    faulthandler.dump_traceback_later(60, exit=True)
+    yield
+    faulthandler.cancel_dump_traceback_later()
+
+
 class TestBaseTransport:
     """Test the BaseTransport abstract base class."""
 
@@ -53,66 +109,196 @@ class TestBaseTransport:
         transport.close()
         assert transport.closed
 
+    def test_scan_frames(self) -> None:
+        """Test frame spans and the resume offset returned by the scanner."""
+        buffer = bytearray(b"x!!&&1\n!!&&2\n!!&&3")
 
-class TestTCPReader:
-    """Test the TCPReader implementation."""
+        spans, pos = scan_frames(buffer, 0)
 
-    @patch("socket.socket")
-    def test_tcp_reader_connection(self, mock_socket_class) -> None:
-        """Test TCP connection setup."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
+        assert [bytes(buffer[a:b]) for a, b in spans] == [b"&&1\n!!", b"&&2\n!!"]
+        assert buffer[pos:] == b"&&3"  # incomplete frame is kept
 
-        reader = TCPReader("localhost", 1234)
+        assert scan_frames(bytearray(b"noise&"), 0) == ([], 5)
 
-        # Start streaming to trigger connection
-        stream_gen: Generator[str, None, None] = reader.stream()
+    def test_scan_frames_drops_runaway_frame(self) -> None:
+        """Test an unterminated frame is abandoned once it exceeds MAX_FRAME_SIZE."""
+        buffer = bytearray(b"&&" + b"0" * MAX_FRAME_SIZE + b"&&2\n")
 
-        # Setup mock to return data then close
-        mock_socket.recv.side_effect = [
-            b"",
-        ]  # Empty data to close connection
+        spans, pos = scan_frames(buffer, 0)
 
-        frames = list(stream_gen)
+        assert spans == []
+        assert buffer[pos:] == b"&&2\n"  # newest frame start is kept
 
-        # Verify connection was attempted
-        mock_socket_class.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
-        mock_socket.connect.assert_called_once_with(("localhost", 1234))
-        assert frames == []
+    def test_stream_prefetched_yields_all_frames(self) -> None:
+        """Test frames read by the background thread arrive in order."""
+        frames = [f"&&\n0108{i}\n!!" for i in range(50)]
+        transport = MockTransport(frames)
 
-    @patch("socket.socket")
-    def test_tcp_reader_receives_frames(self, mock_socket_class) -> None:
-        """Test TCP reader processes WITS frames correctly."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
+        assert list(transport.stream_prefetched(max_pending=4)) == frames
 
-        # Mock data chunks that form complete WITS frames
-        test_data: list[bytes] = [
-            b"&&0101WELL001\n0108650.40\n!!&&0101",
-            b"WELL001\n0108651.50\n!!",
-            b"",  # End connection
+        # Stopping early must not leave the reader thread blocked on the queue
+        prefetched = transport.stream_prefetched(max_pending=1)
+        assert next(prefetched) == frames[0]
+        (pump,) = [
+            t for t in threading.enumerate() if t.name == "MockTransport-prefetch"
         ]
-        mock_socket.recv.side_effect = test_data
+        prefetched.close()
+        pump.join(timeout=2)
+        assert not pump.is_alive()
 
-        reader = TCPReader("localhost", 1234)
+    def test_stream_prefetched_reports_idle(self) -> None:
+        """Test on_idle runs while the source is quiet between frames."""
+
+        class SlowTransport(MockTransport):
+            def stream(self) -> Generator[str, None, None]:
+                yield "&&\n01081\n!!"
+                time.sleep(0.3)
+                yield "&&\n01082\n!!"
+
+        idle_calls: list[int] = []
+        received: list[str] = []
+        for frame in SlowTransport().stream_prefetched(
+            on_idle=lambda: idle_calls.append(len(received)), idle_interval=0.05
+        ):
+            received.append(frame)
+
+        assert received == ["&&\n01081\n!!", "&&\n01082\n!!"]
+        # Idle callbacks fire after the first frame, before the second arrives
+        assert 1 in idle_calls
+
+    def test_stream_prefetched_reraises_errors(self) -> None:
+        """Test an error in stream() surfaces in the consuming thread."""
+
+        class FailingTransport(MockTransport):
+            def stream(self) -> Generator[str, None, None]:
+                yield "&&\n01081\n!!"
+                raise OSError("port went away")
+
+        prefetched = FailingTransport().stream_prefetched()
+        assert next(prefetched) == "&&\n01081\n!!"
+        with pytest.raises(OSError, match="port went away"):
+            next(prefetched)
+
+    def test_stream_batches_groups_available_frames(self) -> None:
+        """Test frames arrive in order, in lists no longer than max_batch."""
+        frames = [f"&&\n0108{i}\n!!" for i in range(50)]
+
+        batches = list(MockTransport(frames).stream_batches(max_batch=8))
+
+        assert [frame for batch in batches for frame in batch] == frames
+        assert all(0 < len(batch) <= 8 for batch in batches)
+
+    def test_stream_batches_reraises_errors(self) -> None:
+        """Test frames read before an error are delivered before it is raised."""
+
+        class FailingTransport(MockTransport):
+            def stream(self) -> Generator[str, None, None]:
+                yield "&&\n01081\n!!"
+                raise OSError("port went away")
+
+        batches = FailingTransport().stream_batches()
+        assert next(batches) == ["&&\n01081\n!!"]
+        with pytest.raises(OSError, match="port went away"):
+            next(batches)
+
+
+class TestTCPReader:
+    """Test the TCPReader implementation against a loopback server."""
+
+    def test_tcp_reader_connection(self) -> None:
+        """Test TCP connection setup, handshake and socket options."""
+        port, requests = serve_once([])
+
+        reader = TCPReader("127.0.0.1", port)
         frames = list(reader.stream())
 
+        assert frames == []
+        assert requests == [TCPReader.DEFAULT_HANDSHAKE_PACKET]
+
+    def test_tcp_reader_receives_frames(self) -> None:
+        """Test TCP reader processes WITS frames correctly."""
+        port, _ = serve_once(
+            [
+                b"&&0101WELL001\n0108650.40\n!!&&0101",
+                b"WELL001\n0108651.50\n!!",
+            ],
+            read_request=False,
+        )
+
+        reader = TCPReader("127.0.0.1", port, send_handshake=False)
+        stream = reader.stream()
+        frames = [next(stream)]
+        assert reader.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        frames.extend(stream)
+
         assert len(frames) == 2
         assert "&&0101WELL001" in frames[0]
         assert "0108650.40" in frames[0]
         assert frames[0].endswith("!!")
 
-    @patch("socket.socket")
-    def test_tcp_reader_handles_connection_error(self, mock_socket_class) -> None:
-        """Test TCP reader handles connection errors gracefully."""
-        mock_socket = Mock()
-        mock_socket_class.return_value = mock_socket
-        mock_socket.recv.side_effect = ConnectionResetError("Connection lost")
+    def test_tcp_reader_filters_own_handshake(self) -> None:
+        """Test handshake packets echoed by the server are not yielded."""
+        port, _ = serve_once(
+            [TCPReader.DEFAULT_HANDSHAKE_PACKET, b"&&\n0108650.40\n!!"],
+            read_request=False,
+        )
 
-        reader = TCPReader("localhost", 1234)
+        frames = list(TCPReader("127.0.0.1", port, send_handshake=False).stream())
+
+        assert frames == ["&&\n0108650.40\n!!"]
+
+    def test_tcp_reader_close_stops_idle_stream(self) -> None:
+        """Test close() from another thread ends a stream on a quiet socket."""
+        port, _ = serve_once([], hold_open=3.0, read_request=False)
+        reader = TCPReader("127.0.0.1", port, send_handshake=False)
+        threading.Timer(0.2, reader.close).start()
+
+        started = time.monotonic()
         frames = list(reader.stream())
 
         assert frames == []
+        assert time.monotonic() - started < 2.0
+
+    def test_tcp_reader_reconnects_after_drop(self, monkeypatch) -> None:
+        """Test reconnect=True reopens the connection and keeps streaming."""
+        monkeypatch.setattr("witskit.transport.tcp_reader.INITIAL_BACKOFF", 0.05)
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(2)
+        server.settimeout(5.0)
+
+        def handle() -> None:
+            with server:
+                for value in (b"650.40", b"651.50"):
+                    conn, _ = server.accept()
+                    with conn:
+                        conn.sendall(b"&&\n0108" + value + b"\n!!")
+
+        threading.Thread(target=handle, daemon=True).start()
+        reader = TCPReader(
+            "127.0.0.1", server.getsockname()[1], send_handshake=False, reconnect=True
+        )
+
+        stream = reader.stream()
+        first = next(stream)
+        assert reader.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        second = next(stream)
+        reader.close()
+        stream.close()
+
+        assert [first, second] == ["&&\n0108650.40\n!!", "&&\n0108651.50\n!!"]
+
+    def test_tcp_reader_handles_connection_error(self) -> None:
+        """Test a connection reset mid-stream ends the stream cleanly."""
+        port, _ = serve_once(
+            [b"&&\n0108650.40\n!!"], hold_open=0.2, read_request=False, reset=True
+        )
+
+        reader = TCPReader("127.0.0.1", port, send_handshake=False)
+        frames = list(reader.stream())
+
+        assert frames == ["&&\n0108650.40\n!!"]
+        assert reader.socket is None
 
     def test_tcp_reader_close(self) -> None:
         """Test TCP reader close functionality."""
@@ -126,12 +312,172 @@ class TestTCPReader:
         assert reader.socket is None
 
 
+class TestRequestingTCPReader:
+    """Test the RequestingTCPReader implementation against a loopback server."""
+
+    def test_requesting_reader_sends_request_and_receives_frames(self) -> None:
+        """Test the request is sent and frames split across chunks are joined."""
+        port, requests = serve_once(
+            [
+                b"noise&&0101WELL001\n0108650.40\n!!&&0101",
+                b"WELL001\n0108651.50\n!",
+                b"!",
+            ]
+        )
+
+        reader = RequestingTCPReader("127.0.0.1", port, request_data=b"&&\r\n")
+        stream = reader.stream()
+        frames = [next(stream)]
+        assert reader.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        # The kernel may cap or double the request, but it should grow
+        assert reader.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) > 65536
+        frames.extend(stream)
+
+        assert requests == [b"&&\r\n"]
+        assert frames == [
+            "&&0101WELL001\n0108650.40\n!!",
+            "&&0101WELL001\n0108651.50\n!!",
+        ]
+        # The connection is closed once the stream ends
+        assert reader.socket is None
+
+    def test_requesting_reader_reuses_connected_socket(self) -> None:
+        """Test a socket handed over from a connectivity probe is used as-is."""
+        port, requests = serve_once([b"&&\n0108650.40\n!!"])
+        probe = socket.create_connection(("127.0.0.1", port))
+
+        reader = RequestingTCPReader("unused.invalid", 0, sock=probe)
+        frames = list(reader.stream())
+        reader.close()
+
+        assert len(requests) == 1
+        assert frames == ["&&\n0108650.40\n!!"]
+
+    def test_requesting_reader_reconnects_on_each_stream(self) -> None:
+        """Test a handed-over socket is used once and later streams reconnect."""
+        port, _ = serve_once([b"&&\n0108650.40\n!!"])
+        probe = socket.create_connection(("127.0.0.1", port))
+        reader = RequestingTCPReader("127.0.0.1", port, sock=probe)
+        assert list(reader.stream()) == ["&&\n0108650.40\n!!"]
+        assert probe.fileno() == -1
+
+        port, requests = serve_once([b"&&\n0108651.50\n!!"])
+        reader.port = port
+        assert list(reader.stream()) == ["&&\n0108651.50\n!!"]
+        assert len(requests) == 1
+
+    def test_requesting_reader_refused_connect_can_be_retried(self) -> None:
+        """Test a failed connect leaves no socket behind and fails the same way again."""
+        unused = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        unused.bind(("127.0.0.1", 0))
+        port = unused.getsockname()[1]
+        unused.close()
+
+        reader = RequestingTCPReader("127.0.0.1", port, timeout=1.0)
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                list(reader.stream())
+            assert reader.socket is None
+
+    def test_requesting_reader_times_out_when_idle(self) -> None:
+        """Test an idle connection ends the stream after the timeout."""
+        port, _ = serve_once([b"&&\n0108650.40\n!!"], hold_open=2.0)
+
+        reader = RequestingTCPReader("127.0.0.1", port, timeout=0.2)
+        started = time.monotonic()
+        frames = list(reader.stream())
+        reader.close()
+
+        assert frames == ["&&\n0108650.40\n!!"]
+        assert time.monotonic() - started < 1.5
+
+
+class TestAsyncTCPReader:
+    """Test the AsyncTCPReader implementation against loopback servers."""
+
+    @staticmethod
+    async def _collect(reader: AsyncTCPReader) -> list[str]:
+        return [frame async for frame in reader.stream()]
+
+    def test_async_reader_receives_frames(self) -> None:
+        """Test handshake, frames split across reads, and handshake filtering."""
+        port, requests = serve_once(
+            [
+                TCPReader.DEFAULT_HANDSHAKE_PACKET,
+                b"&&0101WELL001\n0108650.40\n!!&&0101",
+                b"WELL001\n0108651.50\n!!",
+            ]
+        )
+
+        frames = asyncio.run(self._collect(AsyncTCPReader("127.0.0.1", port)))
+
+        assert requests == [AsyncTCPReader.DEFAULT_HANDSHAKE_PACKET]
+        assert frames == [
+            "&&0101WELL001\n0108650.40\n!!",
+            "&&0101WELL001\n0108651.50\n!!",
+        ]
+
+    def test_async_reader_sends_request(self) -> None:
+        """Test a request-driven server gets the request before any data."""
+        port, requests = serve_once([b"&&\n01083650.40\n!!"])
+
+        reader = AsyncTCPReader(
+            "127.0.0.1", port, send_handshake=False, request_data=b"REQ\r\n"
+        )
+        frames = asyncio.run(self._collect(reader))
+
+        assert requests == [b"REQ\r\n"]
+        assert frames == ["&&\n01083650.40\n!!"]
+
+    def test_async_readers_share_one_loop(self) -> None:
+        """Test several connections are served concurrently on one event loop."""
+        ports = [
+            serve_once([f"&&\n010{i}650.40\n!!".encode()], read_request=False)[0]
+            for i in range(3)
+        ]
+
+        async def gather_all() -> list[list[str]]:
+            readers = [
+                AsyncTCPReader("127.0.0.1", port, send_handshake=False)
+                for port in ports
+            ]
+            return await asyncio.gather(*(self._collect(r) for r in readers))
+
+        results = asyncio.run(gather_all())
+
+        assert results == [[f"&&\n010{i}650.40\n!!"] for i in range(3)]
+
+    def test_async_handshake_failure_is_reported(self) -> None:
+        """Test a failed handshake send reaches on_error and ends the worker."""
+        errors: list[Exception] = []
+        reader = AsyncTCPReader(
+            "127.0.0.1", 0, handshake_interval=0, on_error=errors.append
+        )
+        writer = Mock(is_closing=Mock(return_value=False))
+        writer.drain = AsyncMock(side_effect=ConnectionResetError("reset"))
+
+        asyncio.run(asyncio.wait_for(reader._handshake_worker(writer), 5))
+
+        writer.write.assert_called_once_with(reader.handshake_packet)
+        assert [str(e) for e in errors] == ["reset"]
+
+    def test_async_handshake_stops_when_writer_closes(self) -> None:
+        """Test the handshake worker exits once the connection is closed."""
+        reader = AsyncTCPReader("127.0.0.1", 0, handshake_interval=0)
+        writer = Mock(is_closing=Mock(side_effect=[False, True]))
+        writer.drain = AsyncMock()
+
+        asyncio.run(asyncio.wait_for(reader._handshake_worker(writer), 5))
+
+        writer.write.assert_not_called()
+
+
 class TestFileReader:
     """Test the FileReader implementation."""
 
     def test_file_reader_streams_frames(self) -> None:
         """Test file reader processes WITS frames from file."""
-        test_content = """&&0101WELL001
+        test_content = b"""&&0101WELL001
 0108650.40
 !!
 &&0101WELL001
@@ -149,7 +495,7 @@ class TestFileReader:
 
     def test_file_reader_handles_partial_frames(self) -> None:
         """Test file reader handles incomplete frames."""
-        test_content = """&&0101WELL001
+        test_content = b"""&&0101WELL001
 0108650.40
 !!
 &&0101INCOMPLETE"""
@@ -162,6 +508,15 @@ class TestFileReader:
         assert len(frames) == 1
         assert "0108650.40" in frames[0]
 
+    def test_file_reader_normalizes_line_endings(self) -> None:
+        """Test CRLF and CR line endings come back as LF, as in text mode."""
+        test_content = b"&&\r\n0108650.40\r\n!!\r\n&&\r0108651.50\r!!"
+
+        with patch("builtins.open", mock_open(read_data=test_content)):
+            frames = list(FileReader("test.wits").stream())
+
+        assert frames == ["&&\n0108650.40\n!!", "&&\n0108651.50\n!!"]
+
     def test_file_reader_close(self) -> None:
         """Test file reader close functionality."""
         reader = FileReader("test.wits")
@@ -173,6 +528,33 @@ class TestFileReader:
         mock_file.close.assert_called_once()
         assert reader._file is None
 
+    def test_file_reader_replay_to(self, tmp_path) -> None:
+        """Test a log replayed over a socket arrives byte for byte."""
+        log = tmp_path / "replay.wits"
+        log.write_bytes(b"&&\n0108650.40\n!!\n&&\n0108651.50\n!!\n" * 100)
+
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            assert FileReader(str(log)).replay_to(sender) == log.stat().st_size
+            sender.shutdown(socket.SHUT_WR)
+            received = b""
+            while chunk := receiver.recv(65536):
+                received += chunk
+
+        assert received == log.read_bytes()
+
+    def test_file_reader_reset(self) -> None:
+        """Test file reader can be repointed at another file."""
+        reader = FileReader("first.wits")
+        mock_file = Mock()
+        reader._file = mock_file
+
+        assert reader.reset("second.wits") is reader
+
+        mock_file.close.assert_called_once()
+        assert reader._file is None
+        assert reader.file_path == "second.wits"
+
 
 class TestSerialReader:
     """Test the SerialReader implementation."""
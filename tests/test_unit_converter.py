@@ -201,6 +201,24 @@ class TestUnitConverter:
         factor = UnitConverter.get_conversion_factor(WITSUnits.PSI, WITSUnits.MHR)
         assert factor is None
 
+    def test_get_affine_matches_convert_value(self) -> None:
+        """Test that scale/offset reproduce convert_value."""
+        pairs = [
+            (WITSUnits.KPA, WITSUnits.PSI),
+            (WITSUnits.PSI, WITSUnits.KPA),
+            (WITSUnits.DEGC, WITSUnits.DEGF),
+            (WITSUnits.DEGF, WITSUnits.DEGC),
+            (WITSUnits.UNITLESS, WITSUnits.PSI),
+        ]
+        for from_unit, to_unit in pairs:
+            scale, offset = UnitConverter.get_affine(from_unit, to_unit)
+            for value in (-40.0, 0.0, 123.4):
+                expected = UnitConverter.convert_value(value, from_unit, to_unit)
+                assert abs(value * scale + offset - expected) < 1e-9
+
+        with pytest.raises(ConversionError):
+            UnitConverter.get_affine(WITSUnits.PSI, WITSUnits.MHR)
+
 
 class TestConvenienceFunctions:
     """Test the convenience conversion functions."""
@@ -6,59 +6,277 @@ Clean, modular structure with all commands from the original CLI.
 
 import typer
 import asyncio
+import functools
 import json
 import csv
-from typing import Any, Dict, List, Literal, Optional, Union
+import sys
+import time
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Literal, Optional, Union
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 from datetime import datetime
 
 from witskit import __version__
-from witskit.models.symbols import (
-    WITSSymbol, 
-    WITSUnits, 
-    WITS_SYMBOLS,
-    get_record_types,
-    get_symbols_by_record_type,
-    search_symbols,
-    get_record_description,
-)
-from witskit.models.wits_frame import DecodedFrame
-from witskit.models.unit_converter import UnitConverter, ConversionError
-from witskit.decoder.wits_decoder import (
-    WITSDecoder,
-    decode_frame,
-    decode_file,
-    split_multiple_frames,
-    validate_wits_frame,
-)
-from witskit.transport.tcp_reader import TCPReader
-from witskit.transport.requesting_tcp_reader import RequestingTCPReader
-from witskit.transport.serial_reader import SerialReader
-from witskit.transport.file_reader import FileReader
+from witskit.models.symbols import WITS_SYMBOLS, WITSUnits
 
-# Optional SQL storage imports
 try:
-    from witskit.storage.sql_writer import SQLWriter, DatabaseConfig
-    SQL_AVAILABLE = True
-except ImportError:
-    SQL_AVAILABLE = False
+    import orjson
 
-# Create app and console
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Rich, the decoder, transports and SQL storage are imported inside the
+# commands that use them so `witskit --help` and small commands start fast.
+# The symbol table is loaded by `import witskit` anyway, so lookup tables
+# derived from it are built once at import time below.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from witskit.decoder.wits_decoder import WITSDecoder
+    from witskit.models import DecodedData
+
+# Create app
 app = typer.Typer(
     name="witskit",
     help="Modern Python SDK for WITS drilling data processing",
     no_args_is_help=True,
 )
-console = Console()
+_console_instance: Optional["Console"] = None
+
+# Seconds between console writes while streaming frames
+_STREAM_FLUSH_INTERVAL = 0.1
+
+# Table column specs: (header, style, width)
+_DECODED_COLUMNS = (
+    ("Symbol", "cyan", None),
+    ("Name", "green", None),
+    ("Value", "yellow", None),
+    ("Unit", "blue", None),
+    ("Description", "dim", None),
+)
+_RECORD_COLUMNS = (
+    ("Record", "cyan", 8),
+    ("Description", "white", 40),
+    ("Symbols", "green", 8),
+    ("Category", "yellow", 15),
+)
+_SYMBOLS_COLUMNS = (
+    ("Code", "cyan", 6),
+    ("Rec", "dim cyan", 4),
+    ("Name", "green", 12),
+    ("Type", "blue", 4),
+    ("Metric", "yellow", 10),
+    ("FPS", "yellow", 10),
+    ("Description", "dim", 45),
+)
+
+# Record type -> category, to organize the --list-records table
+_RECORD_CATEGORIES = {
+    record: category
+    for category, records in {
+        "Drilling": (1, 2, 3, 4),
+        "Tripping": (5, 6),
+        "Surveying": (7,),
+        "MWD/LWD": (8, 9),
+        "Evaluation": (10, 12, 13, 14, 15, 16),
+        "Operations": (11, 17, 18),
+        "Configuration": (19, 20, 21),
+        "Reporting": (22, 23),
+        "Marine": (24, 25),
+    }.items()
+    for record in records
+}
+
+# Record type -> number of symbols, for the --list-records table
+_SYMBOL_COUNTS_BY_RECORD = Counter(
+    symbol.record_type for symbol in WITS_SYMBOLS.values()
+)
+
+# Symbol code -> description truncated to the decoded (50) and symbols (40)
+# table column widths
+_DECODED_DESCRIPTIONS, _SYMBOLS_DESCRIPTIONS = (
+    {
+        code: (
+            symbol.description[: width - 3] + "..."
+            if len(symbol.description) > width
+            else symbol.description
+        )
+        for code, symbol in WITS_SYMBOLS.items()
+    }
+    for width in (50, 40)
+)
+
+# Every symbol code, in the order the symbols tables list them
+_SORTED_SYMBOL_CODES = tuple(sorted(WITS_SYMBOLS))
+
+# Unit string as it appears on decoded data (e.g. "F/HR") -> enum, and
+# symbol code -> target unit for --convert-to-metric / --convert-to-fps
+_UNITS_BY_VALUE: Dict[str, WITSUnits] = {unit.value: unit for unit in WITSUnits}
+_METRIC_UNITS: Dict[str, WITSUnits] = {
+    code: symbol.metric_units for code, symbol in WITS_SYMBOLS.items()
+}
+_FPS_UNITS: Dict[str, WITSUnits] = {
+    code: symbol.fps_units for code, symbol in WITS_SYMBOLS.items()
+}
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def _console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+def rprint(*objects: Any, **kwargs: Any) -> None:
+    """Print objects with Rich markup through the shared console."""
+    _console().print(*objects, **kwargs)
+
+
+def _print_plain(text: str) -> None:
+    """Write text and a newline straight to stdout, skipping Rich markup and rendering."""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+
+def _new_table(title: str, columns: tuple[tuple[str, str, Optional[int]], ...]) -> "Table":
+    """Create a Rich table with the given column specs."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style, width in columns:
+        table.add_column(header, style=style, width=width)
+    return table
+
+
+def _write_csv(columns: tuple[tuple[str, str, Optional[int]], ...], rows: Any) -> None:
+    """Write a table as plain CSV to stdout, for output that is piped or redirected."""
+    writer = csv.writer(sys.stdout)
+    writer.writerow(header for header, _, _ in columns)
+    writer.writerows(rows)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class _JSONRecordWriter:
+    """
+    Write ``{"source": ..., "data": [...], "frames": n}`` one record at a time.
+
+    Records reach the file as they are produced, so long streams never hold
+    every decoded frame in memory just to save them at the end. The file is
+    only created by the first record, so a stream that fails before any frame
+    arrives (e.g. a refused connection) leaves no empty output behind.
+    """
+
+    def __init__(self, path: Path, source: str) -> None:
+        self.count = 0
+        self._path = path
+        self._source = source
+        self._file: Optional[BinaryIO] = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one record to the data array."""
+        if self._file is None:
+            self._file = self._path.open("wb")
+            self._file.write(
+                b'{\n  "source": ' + _json_dumps(self._source) + b',\n  "data": ['
+            )
+        # Nest the record's own indentation two levels deeper
+        body = _json_dumps(record).replace(b"\n", b"\n    ")
+        self._file.write((b",\n    " if self.count else b"\n    ") + body)
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the document and close the file, if any record was written."""
+        if self._file is None:
+            return
+        self._file.write(b'\n  ],\n  "frames": %d\n}\n' % self.count)
+        self._file.close()
+        self._file = None
+
+
+def _is_file_argument(data: str) -> bool:
+    """Return True if a CLI argument names an existing file rather than inline WITS data."""
+    # Frame markers, newlines and multi-KB pastes mean inline data, so those
+    # arguments never need a stat() call
+    if len(data) >= 4096 or "\n" in data or "&&" in data or "!!" in data:
+        return False
+    try:
+        return Path(data).is_file()
+    except OSError:  # e.g. name too long for the filesystem
+        return False
+
+
+def _read_frame_input(data: str) -> tuple[str, str]:
+    """
+    Resolve a decode/validate argument to WITS text and a source label.
+
+    Files are read as-is; inline data has escaped "\\n" sequences turned into
+    real newlines (a plain str.replace, which beats a regex substitution here).
+    """
+    if _is_file_argument(data):
+        # One binary read and decode is several times faster than text mode's
+        # incremental decoder on multi-MB logs; newlines are normalized the
+        # way text mode would
+        with open(data, "rb") as f:
+            text = f.read().decode("utf-8", errors="ignore")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text, str(data)
+    return data.replace("\\n", "\n"), "cli_input"
+
+
+def _data_point_row(dp: "DecodedData") -> Dict[str, Any]:
+    """Serialize one decoded data point for multi-frame JSON output."""
+    return {
+        "code": dp.symbol_code,
+        "name": dp.symbol_name,
+        "description": dp.symbol_description,
+        "value": dp.parsed_value,
+        "raw_value": dp.raw_value,
+        "unit": dp.unit,
+    }
+
+
+class CombinedResult:
+    """Data points and errors of a multi-frame decode, displayed like one frame."""
+
+    __slots__ = ("data_points", "errors", "source", "timestamp", "frames_count")
+
+    def __init__(
+        self, data_points: list, errors: list, source: str, frames_count: int
+    ) -> None:
+        self.data_points = data_points
+        self.errors = errors
+        self.source = source
+        self.timestamp = datetime.now()
+        self.frames_count = frames_count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "source": self.source,
+            "frames": self.frames_count,
+            # One row per data point: keying by symbol code would
+            # keep only the last frame's value for each code
+            "data": [_data_point_row(dp) for dp in self.data_points],
+            "errors": self.errors,
+        }
+
+
 def print_error(message: str) -> None:
     """Print an error message in red."""
     rprint(f"[red]Error: {message}[/red]")
@@ -79,6 +297,14 @@ def print_info(message: str) -> None:
     rprint(f"[cyan]{message}[/cyan]")
 
 
+@functools.lru_cache(maxsize=4)
+def _get_decoder(metric: bool = False, strict: bool = False) -> "WITSDecoder":
+    """Return a shared decoder for the given unit system and strictness."""
+    from witskit.decoder.wits_decoder import WITSDecoder
+
+    return WITSDecoder(use_metric_units=metric, strict_mode=strict)
+
+
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
@@ -152,21 +378,15 @@ def decode_command(
         # Decode with FPS units then convert all to metric
         witskit decode data.wits --fps --convert-to-metric
     """
+    from witskit.models.unit_converter import UnitConverter
+    from witskit.decoder.wits_decoder import decode_file, split_multiple_frames
 
     # Validate conversion options
     if convert_to_metric and convert_to_fps:
         print_error("Cannot convert to both metric and FPS units")
         raise typer.Exit(1)
 
-    # Check if data is a file path
-    if Path(data).exists():
-        with open(data, "r") as f:
-            frame_data = f.read()
-        source = str(data)
-    else:
-        # Treat as direct WITS data
-        frame_data = data.replace("\\n", "\n")  # Allow escaped newlines
-        source = "cli_input"
+    frame_data, source = _read_frame_input(data)
 
     try:
         # Check if file contains multiple frames
@@ -175,75 +395,42 @@ def decode_command(
         if len(frames) > 1:
             # Multiple frames - use decode_file
             results = decode_file(
-                frame_data, use_metric_units=metric, strict_mode=strict, source=source
+                frame_data,
+                use_metric_units=metric,
+                strict_mode=strict,
+                source=source,
+                frames=frames,
             )
             # Combine all data points for display
-            all_data_points = []
-            all_errors = []
-            for result in results:
-                all_data_points.extend(result.data_points)
-                all_errors.extend(result.errors)
-
-            # Create a combined result object for display
-            class CombinedResult:
-                def __init__(self, data_points: list, errors: list, source: str) -> None:
-                    self.data_points = data_points
-                    self.errors = errors
-                    self.source = source
-                    self.timestamp = datetime.now()
-
-                def to_dict(self) -> dict[str, Any]:
-                    return {
-                        "timestamp": self.timestamp.isoformat(),
-                        "source": self.source,
-                        "frames": len(results),
-                        "data": {
-                            dp.symbol_code: {
-                                "name": dp.symbol_name,
-                                "description": dp.symbol_description,
-                                "value": dp.parsed_value,
-                                "raw_value": dp.raw_value,
-                                "unit": dp.unit,
-                            }
-                            for dp in self.data_points
-                        },
-                        "errors": self.errors,
-                    }
+            all_data_points = list(chain.from_iterable(r.data_points for r in results))
+            all_errors = list(chain.from_iterable(r.errors for r in results))
 
-            result = CombinedResult(all_data_points, all_errors, source)
+            result = CombinedResult(
+                all_data_points, all_errors, source, frames_count=len(results)
+            )
         else:
             # Single frame
-            result = decode_frame(
-                frame_data, use_metric_units=metric, strict_mode=strict, source=source
-            )
+            result = _get_decoder(metric, strict).decode_frame(frame_data, source)
 
         # Apply unit conversions if requested
         if convert_to_metric or convert_to_fps:
             conversion_errors = []
             converted_count = 0
 
+            target_units = _METRIC_UNITS if convert_to_metric else _FPS_UNITS
             for dp in result.data_points:
                 try:
-                    symbol = WITS_SYMBOLS.get(dp.symbol_code)
-                    if symbol:
-                        current_unit = (
-                            getattr(WITSUnits, dp.unit, None)
-                            if dp.unit != "UNITLESS"
-                            else WITSUnits.UNITLESS
-                        )
-                        target_unit = (
-                            symbol.metric_units if convert_to_metric else symbol.fps_units
-                        )
+                    target_unit = target_units.get(dp.symbol_code)
+                    if target_unit:
+                        current_unit = _UNITS_BY_VALUE.get(dp.unit)
 
-                        if current_unit and target_unit and current_unit != target_unit:
+                        if current_unit and current_unit != target_unit:
                             if UnitConverter.is_convertible(current_unit, target_unit):
                                 if isinstance(dp.parsed_value, (int, float)):
-                                    converted_value = UnitConverter.convert_value(
-                                        float(dp.parsed_value),
-                                        current_unit,
-                                        target_unit,
+                                    scale, offset = UnitConverter.get_affine(
+                                        current_unit, target_unit
                                     )
-                                    dp.parsed_value = converted_value
+                                    dp.parsed_value = float(dp.parsed_value) * scale + offset
                                     dp.unit = target_unit.value
                                     converted_count += 1
                 except Exception as e:
@@ -262,40 +449,43 @@ def decode_command(
 
         # Output results
         if format == "json" or output:
-            output_data = result.to_dict() if hasattr(result, 'to_dict') else {
-                "timestamp": result.timestamp.isoformat(),
-                "source": result.source,
-                "data_points": [
-                    {
-                        "symbol_code": dp.symbol_code,
-                        "symbol_name": dp.symbol_name,
-                        "parsed_value": dp.parsed_value,
-                        "unit": dp.unit,
-                        "description": dp.symbol_description,
-                    }
-                    for dp in result.data_points
-                ],
-                "errors": result.errors,
-            }
+            # Both DecodedFrame and CombinedResult provide to_dict()
+            output_data = result.to_dict()
             if output:
-                with open(output, "w") as f:
-                    json.dump(output_data, f, indent=2)
+                output.write_bytes(_json_dumps(output_data))
                 print_success(f"Results saved to {output}")
             else:
-                rprint(json.dumps(output_data, indent=2))
+                _print_plain(_json_dumps(output_data).decode("utf-8"))
 
         elif format == "raw":
-            for dp in result.data_points:
-                rprint(f"{dp.symbol_code}: {dp.parsed_value} {dp.unit}")
+            if result.data_points:
+                _print_plain(
+                    "\n".join(
+                        f"{dp.symbol_code}: {dp.parsed_value} {dp.unit}"
+                        for dp in result.data_points
+                    )
+                )
 
         else:  # table format
-            if result.data_points:
-                table = Table(title="Decoded WITS Data")
-                table.add_column("Symbol", style="cyan")
-                table.add_column("Name", style="green")
-                table.add_column("Value", style="yellow")
-                table.add_column("Unit", style="blue")
-                table.add_column("Description", style="dim")
+            if not result.data_points:
+                print_warning("No data points decoded")
+            elif not _console().is_terminal:
+                # Piped output: plain CSV with full descriptions
+                _write_csv(
+                    _DECODED_COLUMNS,
+                    (
+                        (
+                            dp.symbol_code,
+                            dp.symbol_name,
+                            dp.parsed_value,
+                            dp.unit,
+                            dp.symbol_description,
+                        )
+                        for dp in result.data_points
+                    ),
+                )
+            else:
+                table = _new_table("Decoded WITS Data", _DECODED_COLUMNS)
 
                 for dp in result.data_points:
                     table.add_row(
@@ -303,12 +493,10 @@ def decode_command(
                         dp.symbol_name,
                         str(dp.parsed_value),
                         dp.unit,
-                        (dp.symbol_description[:50] + "..."
-                         if len(dp.symbol_description) > 50
-                         else dp.symbol_description),
+                        _DECODED_DESCRIPTIONS[dp.symbol_code],
                     )
 
-                console.print(table)
+                _console().print(table, markup=False)
 
                 # Show metadata
                 rprint(f"\n[dim]Source: {result.source}")
@@ -316,8 +504,6 @@ def decode_command(
                 rprint(f"[dim]Data points: {len(result.data_points)}")
                 if result.errors:
                     rprint(f"[red]Errors: {len(result.errors)}")
-            else:
-                print_warning("No data points decoded")
 
         # Show errors if any
         if result.errors:
@@ -363,6 +549,8 @@ def convert_command(
         # Convert temperature
         witskit convert 150 DEGF DEGC
     """
+    from rich.table import Table
+    from witskit.models.unit_converter import UnitConverter, ConversionError
 
     if list_units:
         _show_available_units()
@@ -406,7 +594,7 @@ def convert_command(
             f"{formatted_result:.{precision}f}",
         )
         
-        console.print(table)
+        _console().print(table, markup=False)
 
         # Show formula if requested
         if show_formula:
@@ -435,6 +623,8 @@ def convert_command(
 
 def _show_available_units() -> None:
     """Display all available units organized by category."""
+    from rich.table import Table
+
     rprint("[bold cyan]Available WITS Units\n")
 
     unit_categories = {
@@ -458,7 +648,7 @@ def _show_available_units() -> None:
         for unit in units:
             table.add_row(unit.name, unit.value)
         
-        console.print(table)
+        _console().print(table, markup=False)
         rprint()
 
     rprint("[dim]Example: witskit convert 30 MHR FHR")
@@ -487,57 +677,47 @@ def symbols_command(
     This command provides access to the complete WITS specification with 724 symbols
     across 20+ record types including drilling, logging, and completion data.
     """
+    from witskit.models.symbols import (
+        get_record_types,
+        get_symbols_by_record_type,
+        search_symbols,
+        get_record_description,
+    )
     
     if list_records:
         # Show all record types
-        table = Table(title="WITS Record Types")
-        table.add_column("Record", style="cyan", width=8)
-        table.add_column("Description", style="white", width=40)
-        table.add_column("Symbols", style="green", width=8)
-        table.add_column("Category", style="yellow", width=15)
-
-        # Categorize records for better organization
-        categories = {
-            "Drilling": [1, 2, 3, 4],
-            "Tripping": [5, 6],
-            "Surveying": [7],
-            "MWD/LWD": [8, 9],
-            "Evaluation": [10, 12, 13, 14, 15, 16],
-            "Operations": [11, 17, 18],
-            "Configuration": [19, 20, 21],
-            "Reporting": [22, 23],
-            "Marine": [24, 25],
-        }
+        record_types = get_record_types()  # already sorted
+        rows = [
+            (
+                str(rt),
+                get_record_description(rt),
+                str(_SYMBOL_COUNTS_BY_RECORD[rt]),
+                _RECORD_CATEGORIES.get(rt, "Other"),
+            )
+            for rt in record_types
+        ]
 
-        category_map = {}
-        for cat, records in categories.items():
-            for record in records:
-                category_map[record] = cat
+        # Piped output: plain CSV, no Rich rendering or summary lines
+        if not _console().is_terminal:
+            _write_csv(_RECORD_COLUMNS, rows)
+            return
 
-        for rt in sorted(get_record_types()):
-            symbols_count = len(get_symbols_by_record_type(rt))
-            category = category_map.get(rt, "Other")
-            table.add_row(
-                str(rt), get_record_description(rt), str(symbols_count), category
-            )
+        table = _new_table("WITS Record Types", _RECORD_COLUMNS)
+        for row in rows:
+            table.add_row(*row)
 
-        console.print(table)
+        _console().print(table, markup=False)
 
         total_symbols = len(WITS_SYMBOLS)
-        total_records = len(get_record_types())
+        total_records = len(record_types)
         rprint(f"\n[bold green]Total: {total_records} record types, {total_symbols} symbols")
         rprint(f"[dim]Use --record <number> to see symbols for a specific record type")
         return
 
     # Filter symbols
     if search:
-        symbols_to_show = search_symbols(search)
+        symbols_to_show = search_symbols(search, record_type or None)
         if record_type:
-            symbols_to_show = {
-                code: symbol
-                for code, symbol in symbols_to_show.items()
-                if symbol.record_type == record_type
-            }
             title = f"Record {record_type} Symbols matching '{search}'"
         else:
             title = f"All Symbols matching '{search}'"
@@ -555,21 +735,33 @@ def symbols_command(
         rprint("[dim]Use --list-records to see available record types")
         return
 
+    # Piped output: plain CSV with full descriptions, no Rich rendering
+    if not _console().is_terminal:
+        _write_csv(
+            _SYMBOLS_COLUMNS,
+            (
+                (
+                    code,
+                    symbol.record_type,
+                    symbol.name,
+                    symbol.data_type.value,
+                    symbol.metric_units.value,
+                    symbol.fps_units.value,
+                    symbol.description,
+                )
+                for code in _SORTED_SYMBOL_CODES
+                if (symbol := symbols_to_show.get(code)) is not None
+            ),
+        )
+        return
+
     # Create table
-    table = Table(title=f"{title} ({len(symbols_to_show)} found)")
-    table.add_column("Code", style="cyan", width=6)
-    table.add_column("Rec", style="dim cyan", width=4)
-    table.add_column("Name", style="green", width=12)
-    table.add_column("Type", style="blue", width=4)
-    table.add_column("Metric", style="yellow", width=10)
-    table.add_column("FPS", style="yellow", width=10)
-    table.add_column("Description", style="dim", width=45)
-
-    for code, symbol in sorted(symbols_to_show.items()):
-        description = symbol.description
-        if len(description) > 40:
-            description = description[:37] + "..."
+    table = _new_table(f"{title} ({len(symbols_to_show)} found)", _SYMBOLS_COLUMNS)
 
+    for code in _SORTED_SYMBOL_CODES:
+        symbol = symbols_to_show.get(code)
+        if symbol is None:
+            continue
         table.add_row(
             code,
             str(symbol.record_type),
@@ -577,10 +769,10 @@ def symbols_command(
             symbol.data_type.value,
             symbol.metric_units.value,
             symbol.fps_units.value,
-            description,
+            _SYMBOLS_DESCRIPTIONS[code],
         )
 
-    console.print(table)
+    _console().print(table, markup=False)
 
     # Show helpful hints
     if len(symbols_to_show) > 50:
@@ -612,15 +804,10 @@ def validate_command(
         witskit validate data.wits
     """
     
-    # Check if data is a file path
-    if Path(data).exists():
-        with open(data, "r") as f:
-            frame_data = f.read()
-    else:
-        frame_data = data.replace("\\n", "\n")
+    frame_data, _ = _read_frame_input(data)
 
     try:
-        is_valid = validate_wits_frame(frame_data)
+        is_valid, _ = _get_decoder().validate_frame_format(frame_data)
         if is_valid:
             print_success("Valid WITS frame format")
         else:
@@ -669,6 +856,8 @@ def stream_command(
         # Limit to 10 frames
         witskit stream tcp://localhost:8686 --max-frames 10
     """
+    from witskit.transport.tcp_reader import TCPReader
+    from witskit.transport.file_reader import FileReader
     
     # Parse the source URL
     reader = None
@@ -705,61 +894,109 @@ def stream_command(
         rprint("[dim]Press Ctrl+C to stop streaming...[/dim]\n")
         
         frame_count = 0
-        all_results = []
-        
+        decoder = _get_decoder(metric)
+        # Decoded frames go straight to the output file instead of a list
+        writer = _JSONRecordWriter(output, source) if output else None
+
+        # Frame output is collected and printed at most every
+        # _STREAM_FLUSH_INTERVAL seconds, so fast streams cost one console
+        # write per batch instead of one per frame. Whatever is pending is
+        # also printed as soon as the source goes quiet.
+        pending_lines: List[str] = []
+        started = last_flush = time.monotonic()
+
+        def flush_pending() -> None:
+            nonlocal last_flush
+            if pending_lines:
+                emit("\n".join(pending_lines))
+                pending_lines.clear()
+            last_flush = time.monotonic()
+
+        # Pick the per-frame renderer once rather than branching on every frame.
+        # Raw lines, and status lines nobody sees styled, bypass Rich entirely.
+        if format == "raw":
+            emit = _print_plain
+
+            def render(result, number: int) -> List[str]:
+                return [
+                    f"{dp.symbol_code}: {dp.parsed_value} {dp.unit}"
+                    for dp in result.data_points
+                ]
+        elif not _console().is_terminal:
+            emit = _print_plain
+
+            def render(result, number: int) -> List[str]:
+                return [f"Frame {number}: {len(result.data_points)} data points"]
+        else:
+            emit = rprint
+
+            def render(result, number: int) -> List[str]:
+                return [
+                    f"[green]Frame {number}:[/green] {len(result.data_points)} data points"
+                ]
+
+        # Local bindings keep attribute lookups out of the per-frame loop
+        decode = decoder.decode_frame
+        add_lines = pending_lines.extend
+        monotonic = time.monotonic
+
         try:
-            for frame in reader.stream():
+            # Read ahead in a background thread so waiting on the source
+            # overlaps with decoding and rendering here
+            for frame in reader.stream_prefetched(
+                on_idle=flush_pending, idle_interval=_STREAM_FLUSH_INTERVAL
+            ):
                 if max_frames and frame_count >= max_frames:
                     break
                     
                 try:
-                    result = decode_frame(frame, use_metric_units=metric, source=source)
+                    result = decode(frame, source)
                     frame_count += 1
-                    all_results.append(result)
+                    if writer:
+                        writer.write(
+                            {
+                                "frame": frame_count,
+                                "data_points": [
+                                    {
+                                        "symbol_code": dp.symbol_code,
+                                        "symbol_name": dp.symbol_name,
+                                        "value": dp.parsed_value,
+                                        "unit": dp.unit,
+                                    }
+                                    for dp in result.data_points
+                                ],
+                            }
+                        )
                     
                     # Display frame
-                    if format == "raw":
-                        for dp in result.data_points:
-                            rprint(f"{dp.symbol_code}: {dp.parsed_value} {dp.unit}")
-                    else:
-                        rprint(f"[green]Frame {frame_count}:[/green] {len(result.data_points)} data points")
+                    add_lines(render(result, frame_count))
+                    if monotonic() - last_flush >= _STREAM_FLUSH_INTERVAL:
+                        flush_pending()
                         
                 except Exception as e:
+                    flush_pending()
                     print_warning(f"Failed to decode frame {frame_count + 1}: {e}")
                     
         except KeyboardInterrupt:
+            flush_pending()
             rprint("\n[yellow]Stream interrupted by user[/yellow]")
             
         finally:
+            flush_pending()
             if reader:
                 reader.close()
-                
-        # Save results if output specified
-        if output and all_results:
-            output_data = {
-                "source": source,
-                "frames": frame_count,
-                "data": [
-                    {
-                        "frame": i + 1,
-                        "data_points": [
-                            {
-                                "symbol_code": dp.symbol_code,
-                                "symbol_name": dp.symbol_name,
-                                "value": dp.parsed_value,
-                                "unit": dp.unit,
-                            }
-                            for dp in result.data_points
-                        ]
-                    }
-                    for i, result in enumerate(all_results)
-                ]
-            }
-            with open(output, "w") as f:
-                json.dump(output_data, f, indent=2)
-            print_success(f"Saved {frame_count} frames to {output}")
-            
-        rprint(f"\n[green]Processed {frame_count} frames total[/green]")
+            if writer:
+                writer.close()
+
+        if writer and writer.count:
+            print_success(f"Saved {writer.count} frames to {output}")
+
+        elapsed = time.monotonic() - started
+        rate = f", {frame_count / elapsed:.1f} frames/s" if elapsed > 0 else ""
+        rprint(
+            f"\n[green]Processed {frame_count} frames total[/green] "
+            f"[dim]({elapsed:.2f}s{rate})[/dim]"
+        )
         
     except Exception as e:
         print_error(f"Stream error: {e}")
@@ -797,7 +1034,9 @@ def sql_query_command(
         witskit sql-query sqlite:///drilling_data.db --symbols "0108,0113"
     """
     
-    if not SQL_AVAILABLE:
+    try:
+        from witskit.storage.sql_writer import SQLWriter, DatabaseConfig
+    except ImportError:
         print_error("SQL functionality not available. Install with: pip install witskit[sql]")
         raise typer.Exit(1)
         
@@ -830,21 +1069,14 @@ def demo_command() -> None:
 !!"""
 
     rprint("[dim]Sample WITS frame:")
-    for line in sample_frame.split("\n"):
-        if line.strip():
-            rprint(f"[dim]  {line}")
+    rprint("\n".join(f"[dim]  {line}" for line in sample_frame.split("\n") if line.strip()))
     rprint()
 
     # Decode it
-    result = decode_frame(sample_frame, source="demo")
+    result = _get_decoder().decode_frame(sample_frame, "demo")
 
     if result.data_points:
-        table = Table(title="Decoded Sample Data")
-        table.add_column("Symbol", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Value", style="yellow")
-        table.add_column("Unit", style="blue")
-        table.add_column("Description", style="dim")
+        table = _new_table("Decoded Sample Data", _DECODED_COLUMNS)
 
         for dp in result.data_points:
             table.add_row(
@@ -855,7 +1087,7 @@ def demo_command() -> None:
                 dp.symbol_description,
             )
 
-        console.print(table)
+        _console().print(table, markup=False)
 
         print_success(f"Successfully decoded {len(result.data_points)} parameters")
 
@@ -5,13 +5,56 @@ This module provides the main decoder functionality for converting
 WITS ASCII frames into typed Python objects with full validation.
 """
 
+import re
 from datetime import datetime
 from typing import List, Literal, Optional, Tuple, Union
 from loguru import logger
 
 # Always use absolute imports to avoid type conflicts
 from ..models import WITSFrame, DecodedData, DecodedFrame, WITSSymbol
-from ..models.symbols import get_symbol_by_code, WITS_SYMBOLS
+from ..models.symbols import WITS_SYMBOLS
+
+
+# Frames whose data lines all start with a 4-digit code; anything else
+# (blank lines, malformed codes) goes through the general per-line path.
+_WELL_FORMED_FRAME = re.compile(
+    r"&&[^\n]*\n((?:[^\S\n]*[0-9]{4}[^\n]*\n)+)[^\S\n]*!![^\n]*"
+)
+# (stripped line, symbol code, stripped value) for each data line
+_DATA_LINE = re.compile(r"^[^\S\n]*(([0-9]{4})[^\S\n]*(.*?))[^\S\n]*$", re.M)
+
+
+def _split_data_line(line: str) -> Tuple[str, str]:
+    """
+    Split a WITS data line into its symbol code and raw value.
+
+    This is the per-line parsing kernel shared by the decoder; it avoids
+    any model construction so bulk ingest pays only for string slicing.
+
+    Args:
+        line: Single data line (e.g., "01083650.40")
+
+    Returns:
+        Tuple of (symbol_code, raw_value)
+
+    Raises:
+        ValueError: If the line is too short or the code is not numeric
+    """
+    if len(line) < 4:
+        raise ValueError(f"Line too short: {line}")
+
+    symbol_code = line[:4]
+    if not symbol_code.isdigit():
+        raise ValueError(f"Invalid symbol code: {symbol_code}")
+
+    return symbol_code, line[4:].strip()
+
+
+def _as_str(raw_frame: Union[str, bytes, bytearray, memoryview]) -> str:
+    """Decode frame bytes the way the transports do; strings pass through."""
+    if isinstance(raw_frame, str):
+        return raw_frame
+    return bytes(raw_frame).decode("utf-8", errors="ignore")
 
 
 class WITSDecoder:
@@ -33,13 +76,14 @@ class WITSDecoder:
         self.strict_mode: bool = strict_mode
 
     def decode_frame(
-        self, raw_frame: str, source: Optional[str] = None
+        self, raw_frame: Union[str, bytes], source: Optional[str] = None
     ) -> DecodedFrame:
         """
         Decode a complete WITS frame into structured data.
 
         Args:
-            raw_frame: Raw WITS frame string (with && and !! markers)
+            raw_frame: Raw WITS frame (with && and !! markers), as a string or as
+                the UTF-8 bytes read from the wire
             source: Optional source identifier for the frame
 
         Returns:
@@ -48,18 +92,33 @@ class WITSDecoder:
         Raises:
             ValueError: If frame format is invalid and strict_mode is True
         """
+        raw_frame = _as_str(raw_frame)
+
         try:
             # Create and validate the WITS frame
             wits_frame = WITSFrame(raw_data=raw_frame, source=source)
 
             decoded_frame = DecodedFrame(frame=wits_frame)
 
+            match = _WELL_FORMED_FRAME.fullmatch(raw_frame.strip())
+            if match:
+                # Fast path: the regex has already split and validated each line
+                entries = _DATA_LINE.findall(match.group(1))
+            else:
+                entries = [(line, None, None) for line in wits_frame.data_lines]
+
             # Process each data line
-            for line in wits_frame.data_lines:
+            for line, symbol_code, raw_value in entries:
                 try:
-                    data_point: DecodedData | None = self._decode_data_line(
-                        line, wits_frame.timestamp, source
-                    )
+                    data_point: DecodedData | None
+                    if symbol_code is None:
+                        data_point = self._decode_data_line(
+                            line, wits_frame.timestamp, source
+                        )
+                    else:
+                        data_point = self._decode_symbol_value(
+                            symbol_code, raw_value, wits_frame.timestamp, source
+                        )
                     if data_point:
                         decoded_frame.data_points.append(data_point)
                 except Exception as e:
@@ -71,8 +130,9 @@ class WITSDecoder:
                         raise ValueError(error_msg) from e
 
             logger.debug(
-                f"Decoded WITS frame with {len(decoded_frame.data_points)} data points "
-                f"and {len(decoded_frame.errors)} errors"
+                "Decoded WITS frame with {} data points and {} errors",
+                len(decoded_frame.data_points),
+                len(decoded_frame.errors),
             )
 
             return decoded_frame
@@ -105,50 +165,67 @@ class WITSDecoder:
             return None
 
         try:
-            # Parse the line into symbol code and value
-            if len(line) < 4:
-                raise ValueError(f"Line too short: {line}")
-
-            symbol_code: str = line[:4]
-            raw_value: str = line[4:].strip()
-
-            if not symbol_code.isdigit():
-                raise ValueError(f"Invalid symbol code: {symbol_code}")
-
-            # Look up the symbol definition
-            symbol: WITSSymbol | None = get_symbol_by_code(symbol_code)
-            if not symbol:
-                if self.strict_mode:
-                    raise ValueError(f"Unknown symbol code: {symbol_code}")
-                else:
-                    logger.warning(f"Unknown symbol code: {symbol_code}, skipping")
-                    return None
-
-            # Determine the unit to use
-            unit: str = (
-                symbol.metric_units.value
-                if self.use_metric_units
-                else symbol.fps_units.value
-            )
-
-            # Create the decoded data point
-            decoded_data = DecodedData(
-                symbol=symbol,
-                raw_value=raw_value,
-                unit=unit,
-                timestamp=timestamp,
-                source=source,
-            ) # pyright: ignore[reportCallIssue]
+            symbol_code, raw_value = _split_data_line(line)
+            return self._decode_symbol_value(symbol_code, raw_value, timestamp, source)
+        except Exception as e:
+            logger.error("Failed to decode line '{}': {}", line, e)
+            raise
 
-            logger.debug(
-                f"Decoded {symbol_code} ({symbol.name}): {raw_value} -> {decoded_data.parsed_value} {unit}"
-            )
+    def _decode_symbol_value(
+        self,
+        symbol_code: str,
+        raw_value: str,
+        timestamp: datetime,
+        source: Optional[str],
+    ) -> Optional[DecodedData]:
+        """
+        Build a DecodedData for an already split symbol code and value.
 
-            return decoded_data
+        Args:
+            symbol_code: 4-digit WITS symbol code
+            raw_value: Value string with surrounding whitespace removed
+            timestamp: Timestamp for the data point
+            source: Source identifier
 
-        except Exception as e:
-            logger.error(f"Failed to decode line '{line}': {str(e)}")
-            raise
+        Returns:
+            DecodedData object or None if the symbol is unknown (non-strict mode)
+        """
+        # Look up the symbol definition
+        symbol: WITSSymbol | None = WITS_SYMBOLS.get(symbol_code)
+        if not symbol:
+            if self.strict_mode:
+                raise ValueError(f"Unknown symbol code: {symbol_code}")
+            else:
+                logger.warning("Unknown symbol code: {}, skipping", symbol_code)
+                return None
+
+        # Determine the unit to use
+        unit: str = (
+            symbol.metric_units.value
+            if self.use_metric_units
+            else symbol.fps_units.value
+        )
+
+        # Create the decoded data point
+        decoded_data = DecodedData(
+            symbol=symbol,
+            raw_value=raw_value,
+            unit=unit,
+            timestamp=timestamp,
+            source=source,
+        ) # pyright: ignore[reportCallIssue]
+
+        # Lazy formatting: the message is only built if DEBUG is enabled
+        logger.debug(
+            "Decoded {} ({}): {} -> {} {}",
+            symbol_code,
+            symbol.name,
+            raw_value,
+            decoded_data.parsed_value,
+            unit,
+        )
+
+        return decoded_data
 
     def decode_multiple_frames(
         self, frame_data: List[str], source: Optional[str] = None
@@ -169,7 +246,7 @@ class WITSDecoder:
                 decoded: DecodedFrame = self.decode_frame(frame, source)
                 results.append(decoded)
             except Exception as e:
-                logger.error(f"Failed to decode frame {i}: {str(e)}")
+                logger.error("Failed to decode frame {}: {}", i, e)
                 if self.strict_mode:
                     raise
 
@@ -194,7 +271,7 @@ class WITSDecoder:
 
 # Convenience functions for direct usage
 def decode_frame(
-    raw_frame: str,
+    raw_frame: Union[str, bytes],
     use_metric_units: bool = False,
     strict_mode: bool = False,
     source: Optional[str] = None,
@@ -203,7 +280,7 @@ def decode_frame(
     Convenience function to decode a single WITS frame.
 
     Args:
-        raw_frame: Raw WITS frame string
+        raw_frame: Raw WITS frame string or bytes
         use_metric_units: If True, use metric units, otherwise use FPS units (default)
         strict_mode: If True, raise errors for unknown symbols
         source: Optional source identifier
@@ -284,6 +361,7 @@ def decode_file(
     use_metric_units: bool = False,
     strict_mode: bool = False,
     source: Optional[str] = None,
+    frames: Optional[List[str]] = None,
 ) -> List[DecodedFrame]:
     """
     Decode a file containing one or more WITS frames.
@@ -293,12 +371,15 @@ def decode_file(
         use_metric_units: If True, use metric units, otherwise use FPS units (default)
         strict_mode: If True, raise errors for unknown symbols
         source: Optional source identifier
+        frames: file_data already split with split_multiple_frames(), to skip
+            splitting it again
 
     Returns:
         List of DecodedFrame objects
     """
     decoder = WITSDecoder(use_metric_units=use_metric_units, strict_mode=strict_mode)
-    frames: List[str] = split_multiple_frames(file_data)
+    if frames is None:
+        frames = split_multiple_frames(file_data)
 
     if not frames:
         raise ValueError("No valid WITS frames found in data")
@@ -311,7 +392,7 @@ def decode_file(
             )
             results.append(decoded)
         except Exception as e:
-            logger.error(f"Failed to decode frame {i+1}: {str(e)}")
+            logger.error("Failed to decode frame {}: {}", i + 1, e)
             if strict_mode:
                 raise
 
@@ -7,6 +7,7 @@ from all 25 record types, automatically generated from WITSRecords.htm.
 Based on the WITS (Wellsite Information Transfer Standard) specification.
 """
 
+import functools
 from enum import Enum
 from typing import Dict, Optional, Union, List
 from pydantic import BaseModel, ConfigDict
@@ -8490,11 +8491,24 @@ def get_record_description(record_type: int) -> str:
     return RECORD_DESCRIPTIONS.get(record_type, f"Record {record_type}")
 
 
-def search_symbols(query: str) -> Dict[str, WITSSymbol]:
-    """Search symbols by name or description."""
-    query = query.lower()
+@functools.lru_cache(maxsize=1)
+def _symbol_search_index() -> Dict[str, str]:
+    """Build one lowercased name/description/code haystack per symbol for searching."""
+    # \x1f (unit separator) keeps a query from matching across field boundaries
     return {
-        code: symbol
+        code: f"{symbol.name}\x1f{symbol.description}\x1f{code}".lower()
         for code, symbol in WITS_SYMBOLS.items()
-        if query in symbol.name.lower() or query in symbol.description.lower()
+    }
+
+
+def search_symbols(
+    query: str, record_type: Optional[int] = None
+) -> Dict[str, WITSSymbol]:
+    """Search symbols by code, name or description, optionally within one record type."""
+    query = query.lower()
+    return {
+        code: WITS_SYMBOLS[code]
+        for code, haystack in _symbol_search_index().items()
+        if query in haystack
+        and (record_type is None or WITS_SYMBOLS[code].record_type == record_type)
     }
@@ -6,6 +6,7 @@ specifically for drilling industry measurements like rate of penetration,
 pressure, flow rates, and other drilling parameters.
 """
 
+import functools
 from typing import Dict, Optional, Union
 from enum import Enum
 from .symbols import WITSUnits
@@ -131,6 +132,7 @@ class UnitConverter:
         return (fahrenheit - 32) * 5 / 9
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def get_conversion_factor(
         cls, from_unit: WITSUnits, to_unit: WITSUnits
     ) -> Optional[float]:
@@ -158,6 +160,7 @@ class UnitConverter:
         return None
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def is_convertible(cls, from_unit: WITSUnits, to_unit: WITSUnits) -> bool:
         """
         Check if conversion between two units is supported.
@@ -187,6 +190,39 @@ class UnitConverter:
             or from_unit.value == to_unit.value
         )
 
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def get_affine(cls, from_unit: WITSUnits, to_unit: WITSUnits) -> tuple[float, float]:
+        """
+        Get the (scale, offset) such that converted = value * scale + offset.
+
+        Every supported conversion is affine, so callers converting many
+        values between the same pair of units can look this up once.
+
+        Args:
+            from_unit: Source unit
+            to_unit: Target unit
+
+        Returns:
+            Tuple of (scale, offset)
+
+        Raises:
+            ConversionError: If conversion is not supported or units are incompatible
+        """
+        if from_unit == WITSUnits.DEGC and to_unit == WITSUnits.DEGF:
+            return 9 / 5, 32.0
+        if from_unit == WITSUnits.DEGF and to_unit == WITSUnits.DEGC:
+            return 5 / 9, -32 * 5 / 9
+
+        if not cls.is_convertible(from_unit, to_unit):
+            raise ConversionError(
+                f"Conversion from {from_unit.value} to {to_unit.value} is not supported"
+            )
+
+        factor: Optional[float] = cls.get_conversion_factor(from_unit, to_unit)
+        # Unitless and same-valued units pass through unchanged
+        return (1.0 if factor is None else factor), 0.0
+
     @classmethod
     def get_unit_category(cls, unit: WITSUnits) -> str:
         """
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
 try:
-    from sqlalchemy import select, func, and_, or_, desc
+    from sqlalchemy import event, select, insert, func, and_, or_, desc
     from sqlalchemy.ext.asyncio import (
         create_async_engine,
         AsyncSession,
@@ -42,6 +42,16 @@ from ..models.wits_frame import DecodedFrame, DecodedData
 from ..models.symbols import WITS_SYMBOLS
 
 
+# SQLite settings suited to bulk ingest: WAL avoids an fsync per commit while
+# keeping the database consistent, and a 64 MiB page cache keeps indexes hot.
+SQLITE_INGEST_PRAGMAS: Dict[str, str] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+
+
 @dataclass
 class DatabaseConfig:
     """Configuration for database connection."""
@@ -52,6 +62,7 @@ class DatabaseConfig:
 
     # SQLite specific
     sqlite_path: Optional[str] = None
+    sqlite_pragmas: Optional[Dict[str, str]] = None  # PRAGMAs run on each connect
 
     # PostgreSQL/MySQL specific
     host: Optional[str] = None
@@ -66,12 +77,18 @@ class DatabaseConfig:
     max_overflow: int = 10
 
     @classmethod
-    def sqlite(cls, path: str = "wits_data.db", echo: bool = False) -> "DatabaseConfig":
-        """Create SQLite configuration."""
+    def sqlite(
+        cls,
+        path: str = "wits_data.db",
+        echo: bool = False,
+        pragmas: Optional[Dict[str, str]] = None,
+    ) -> "DatabaseConfig":
+        """Create SQLite configuration, optionally with PRAGMAs such as SQLITE_INGEST_PRAGMAS."""
         return cls(
             database_type="sqlite",
             database_url=f"sqlite+aiosqlite:///{path}",
             sqlite_path=path,
+            sqlite_pragmas=pragmas,
             echo_sql=echo,
         )
 
@@ -150,13 +167,23 @@ class SQLWriter(BaseStorage):
 
     async def initialize(self) -> None:
         """Initialize database connection and create tables."""
-        # Create async engine
-        self.engine = create_async_engine(
-            self.config.database_url,
-            echo=self.config.echo_sql,
-            pool_size=self.config.pool_size,
-            max_overflow=self.config.max_overflow,
-        )
+        # Create async engine; in-memory SQLite runs on a single static
+        # connection, which takes no pool sizing arguments.
+        engine_kwargs: Dict[str, Any] = {"echo": self.config.echo_sql}
+        if self.config.sqlite_path != ":memory:":
+            engine_kwargs["pool_size"] = self.config.pool_size
+            engine_kwargs["max_overflow"] = self.config.max_overflow
+        self.engine = create_async_engine(self.config.database_url, **engine_kwargs)
+
+        if self.config.database_type == "sqlite" and self.config.sqlite_pragmas:
+            pragmas = dict(self.config.sqlite_pragmas)
+
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+                cursor.close()
 
         # Create session factory
         self.session_factory = async_sessionmaker(
@@ -226,24 +253,25 @@ class SQLWriter(BaseStorage):
             return
 
         async with self.get_session() as session:
-            frame_objs = []
-            data_point_objs = []
-
-            for decoded_frame in frames:
-                # Create frame object
-                frame_obj = WITSFrame(
+            created_at = datetime.utcnow()
+            frame_objs = [
+                WITSFrame(
                     timestamp=decoded_frame.timestamp,
                     source=decoded_frame.source,
                     raw_data=decoded_frame.frame.raw_data,
-                    created_at=datetime.utcnow(),
+                    created_at=created_at,
                 )
-                frame_objs.append(frame_obj)
-                session.add(frame_obj)
+                for decoded_frame in frames
+            ]
+            session.add_all(frame_objs)
 
-                # Flush to get frame ID
-                await session.flush()
+            # One flush for the whole batch assigns every frame ID
+            await session.flush()
 
-                # Create data point objects
+            # Build plain rows so data points go out as a single executemany
+            data_point_rows = []
+            for frame_obj, decoded_frame in zip(frame_objs, frames):
+                frame_id = frame_obj.id
                 for data_point in decoded_frame.data_points:
                     # Determine value storage
                     numeric_value = None
@@ -254,21 +282,23 @@ class SQLWriter(BaseStorage):
                     elif data_point.parsed_value is not None:
                         string_value = str(data_point.parsed_value)
 
-                    data_point_obj = WITSDataPoint(
-                        frame_id=frame_obj.id,
-                        symbol_code=data_point.symbol_code,
-                        timestamp=data_point.timestamp,
-                        source=data_point.source,
-                        raw_value=data_point.raw_value,
-                        numeric_value=numeric_value,
-                        string_value=string_value,
-                        unit=data_point.unit,
-                        created_at=datetime.utcnow(),
+                    data_point_rows.append(
+                        {
+                            "frame_id": frame_id,
+                            "symbol_code": data_point.symbol_code,
+                            "timestamp": data_point.timestamp,
+                            "source": data_point.source,
+                            "raw_value": data_point.raw_value,
+                            "numeric_value": numeric_value,
+                            "string_value": string_value,
+                            "unit": data_point.unit,
+                            "created_at": created_at,
+                        }
                     )
-                    data_point_objs.append(data_point_obj)
 
             # Bulk insert data points
-            session.add_all(data_point_objs)
+            if data_point_rows:
+                await session.execute(insert(WITSDataPoint), data_point_rows)
 
             # Update source statistics
             await self._update_source_stats(session, frames)
@@ -385,31 +415,9 @@ class SQLWriter(BaseStorage):
     ) -> AsyncGenerator[DecodedData, None]:
         """Query specific data points with timeseries filtering."""
         async with self.get_session() as session:
-            query = (
-                select(WITSDataPoint)
-                .options(selectinload(WITSDataPoint.symbol_def))
-                .where(WITSDataPoint.symbol_code.in_(symbol_codes))
+            query = self._data_points_query(
+                symbol_codes, start_time, end_time, source, limit
             )
-
-            # Apply filters
-            conditions = []
-            if start_time:
-                conditions.append(WITSDataPoint.timestamp >= start_time)
-            if end_time:
-                conditions.append(WITSDataPoint.timestamp <= end_time)
-            if source:
-                conditions.append(WITSDataPoint.source == source)
-
-            if conditions:
-                query = query.where(and_(*conditions))
-
-            # Order by timestamp
-            query = query.order_by(WITSDataPoint.timestamp)
-
-            # Apply limit
-            if limit:
-                query = query.limit(limit)
-
             result = await session.execute(query)
             data_points = result.scalars().all()
 
@@ -417,6 +425,66 @@ class SQLWriter(BaseStorage):
             for dp in data_points:
                 yield await self._convert_to_decoded_data(dp)
 
+    async def query_data_points_all(
+        self,
+        symbol_codes: List[str],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[DecodedData]:
+        """
+        Query specific data points and return them all as a list.
+
+        Same filters as query_data_points(), but avoids a round trip through
+        the event loop per row. Prefer it for small, bounded result sets.
+        """
+        async with self.get_session() as session:
+            query = self._data_points_query(
+                symbol_codes, start_time, end_time, source, limit
+            )
+            result = await session.execute(query)
+            return [
+                await self._convert_to_decoded_data(dp)
+                for dp in result.scalars().all()
+            ]
+
+    def _data_points_query(
+        self,
+        symbol_codes: List[str],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        source: Optional[str],
+        limit: Optional[int],
+    ):
+        """Build the SELECT statement shared by the data point queries."""
+        query = (
+            select(WITSDataPoint)
+            .options(selectinload(WITSDataPoint.symbol_def))
+            .where(WITSDataPoint.symbol_code.in_(symbol_codes))
+        )
+
+        # Apply filters
+        conditions = []
+        if start_time:
+            conditions.append(WITSDataPoint.timestamp >= start_time)
+        if end_time:
+            conditions.append(WITSDataPoint.timestamp <= end_time)
+        if source:
+            conditions.append(WITSDataPoint.source == source)
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        # Order by timestamp
+        query = query.order_by(WITSDataPoint.timestamp)
+
+        # Apply limit
+        if limit:
+            query = query.limit(limit)
+
+        return query
+
     async def get_available_symbols(self, source: Optional[str] = None) -> List[str]:
         """Get list of available symbol codes in storage."""
         async with self.get_session() as session:
@@ -9,6 +9,7 @@ readers with automatic handshaking support.
 from .base import BaseTransport
 from .tcp_reader import TCPReader
 from .requesting_tcp_reader import RequestingTCPReader
+from .async_tcp_reader import AsyncTCPReader
 from .serial_reader import SerialReader
 from .file_reader import FileReader
 from .pason_tcp_reader import PasonTCPReader
@@ -18,6 +19,7 @@ __all__: list[str] = [
     "BaseTransport",
     "TCPReader",
     "RequestingTCPReader",
+    "AsyncTCPReader",
     "SerialReader",
     "FileReader",
     "PasonTCPReader",
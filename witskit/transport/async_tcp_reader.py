@@ -0,0 +1,132 @@
+"""Asyncio TCP transport reader for serving many WITS streams from one thread."""
+
+import asyncio
+import socket
+from typing import AsyncGenerator, Callable, Optional
+from .base import (
+    COMPACT_THRESHOLD,
+    RECV_SIZE,
+    SOCKET_RCVBUF,
+    BaseTransport,
+    scan_frames,
+)
+
+
+class AsyncTCPReader(BaseTransport):
+    """TCP reader that yields frames with ``async for``.
+
+    One event loop can drive many of these readers, so aggregating dozens
+    of rigs costs one thread instead of one thread per connection.
+
+    Example:
+        async for frame in AsyncTCPReader("10.0.0.5", 12345).stream():
+            ...
+    """
+
+    __slots__ = ("host", "port", "request_data", "recv_size", "_writer")
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        send_handshake: bool = True,
+        handshake_interval: int = 30,
+        custom_handshake: Optional[bytes] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        recv_size: int = RECV_SIZE,
+        request_data: Optional[bytes] = None,
+    ) -> None:
+        """Initialize asyncio TCP reader with handshaking support.
+
+        Args:
+            host: The host to connect to
+            port: The port to connect to
+            send_handshake: Whether to send automatic handshake packets (default: True)
+            handshake_interval: Interval between handshakes in seconds (default: 30)
+            custom_handshake: Custom handshake packet (default: uses WitsKit standard)
+            on_error: Optional error callback function
+            recv_size: Bytes requested per read (default: 64 KiB)
+            request_data: Request sent once on connect, for servers that wait for
+                one before streaming, as with RequestingTCPReader (default: none)
+        """
+        super().__init__(send_handshake, handshake_interval, custom_handshake, on_error)
+        self.host: str = host
+        self.port: int = port
+        self.recv_size: int = recv_size
+        self.request_data: Optional[bytes] = request_data
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def _handshake_worker(self, writer: asyncio.StreamWriter) -> None:
+        """Background task that sends handshake packets.
+
+        Runs until it is cancelled or the writer is closed. A failed send is
+        reported and ends the task: this reader does not reconnect, so the
+        read loop will see the same dead connection.
+        """
+        while not writer.is_closing():
+            await asyncio.sleep(self.handshake_interval)
+            if writer.is_closing():
+                break
+            try:
+                writer.write(self.handshake_packet)
+                await writer.drain()
+            except Exception as e:
+                self._report_error(e)
+                break
+
+    async def stream(self) -> AsyncGenerator[str, None]:  # type: ignore[override]
+        """Stream WITS frames from TCP connection with automatic handshaking."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self._writer = writer
+        sock: Optional[socket.socket] = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        handshake_task: Optional[asyncio.Task] = None
+        try:
+            if self.request_data:
+                writer.write(self.request_data)
+                await writer.drain()
+
+            if self.send_handshake:
+                writer.write(self.handshake_packet)
+                await writer.drain()
+                handshake_task = asyncio.create_task(self._handshake_worker(writer))
+
+            # Same byte scanner as the threaded readers
+            buffer = bytearray()
+            pos: int = 0
+            while True:
+                try:
+                    chunk: bytes = await reader.read(self.recv_size)
+                    if not chunk:  # Connection closed
+                        break
+
+                    buffer += chunk
+                    spans, pos = scan_frames(buffer, pos)
+                    for start, end in spans:
+                        frame = buffer[start:end].decode("utf-8", errors="ignore")
+
+                        # Filter out our own handshake packets
+                        if not self._is_handshake_packet(frame):
+                            yield frame
+
+                    if pos > COMPACT_THRESHOLD or pos > len(buffer) // 2:
+                        del buffer[:pos]
+                        pos = 0
+                except ConnectionResetError:
+                    break
+                except Exception as e:
+                    self._report_error(e)
+                    break
+        finally:
+            if handshake_task:
+                handshake_task.cancel()
+            self.close()
+
+    def close(self) -> None:
+        """Close the TCP connection."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
@@ -1,10 +1,91 @@
+import queue
+import selectors
+import socket
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Generator, Optional, Callable
+from typing import Callable, Generator, List, Optional, Tuple
+from loguru import logger
+
+# Queue marker for the end of a prefetched stream
+_END_OF_STREAM = object()
+
+# Bytes requested per recv; large reads take whole TCP bursts in one syscall
+RECV_SIZE = 64 * 1024
+# Consumed bytes are trimmed from the receive buffer once they exceed this
+COMPACT_THRESHOLD = 64 * 1024
+# An unterminated frame is dropped once it grows past this, so a feed that
+# loses its "!!" markers cannot grow the receive buffer without bound
+MAX_FRAME_SIZE = 1024 * 1024
+# Kernel receive buffer requested for TCP sockets (capped by net.core.rmem_max)
+SOCKET_RCVBUF = 2 * 1024 * 1024
+# Longest a stream waits on a quiet socket before checking for close()
+STOP_POLL_INTERVAL = 0.5
+# TCP keepalive: first probe after KEEPALIVE_IDLE seconds of silence, then every
+# KEEPALIVE_INTERVAL seconds; the peer is declared dead after KEEPALIVE_COUNT misses
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+
+def scan_frames(buffer: bytearray, pos: int) -> Tuple[List[Tuple[int, int]], int]:
+    """Locate every complete ``&&``...``!!`` frame in a byte buffer.
+
+    Scanning uses bytes.find, which runs in C, and each search resumes
+    from the last match so no byte is examined twice.
+
+    Args:
+        buffer: Received bytes
+        pos: Offset where unconsumed data starts
+
+    Returns:
+        Tuple of ([(start, end), ...] frame spans, offset to resume from)
+    """
+    spans: List[Tuple[int, int]] = []
+    find = buffer.find
+    while True:
+        start = find(b"&&", pos)
+        if start == -1:
+            # Nothing but noise; keep a trailing "&" that may pair up
+            return spans, max(pos, len(buffer) - 1)
+        end = find(b"!!", start + 2)
+        if end == -1:
+            if len(buffer) - start > MAX_FRAME_SIZE:
+                # No "!!" follows, so resume from the newest "&&", if any
+                last = buffer.rfind(b"&&", start + 2)
+                return spans, last if last != -1 else len(buffer) - 1
+            return spans, start
+        pos = end + 2
+        spans.append((start, pos))
+
+
+def enable_keepalive(sock: socket.socket) -> None:
+    """Turn on TCP keepalive so a silently dead peer is noticed within a minute.
+
+    The probe timing options are set where the platform provides them;
+    elsewhere the OS defaults (often two hours of idle time) apply.
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
 
 
 class BaseTransport(ABC):
     """Base class for WITS transport implementations."""
 
+    __slots__ = (
+        "send_handshake",
+        "handshake_interval",
+        "handshake_packet",
+        "on_error",
+    )
+
     # Default WitsKit handshake packet with custom header
     # Uses TVD (Total Vertical Depth) symbol 0111 with dummy value -9999
     DEFAULT_HANDSHAKE_PACKET = b"&&\r\n1984WITSKIT\r\n0111-9999\r\n!!\r\n"
@@ -37,6 +118,211 @@ class BaseTransport(ABC):
         """
         pass
 
+    def stream_prefetched(
+        self,
+        max_pending: int = 1024,
+        on_idle: Optional[Callable[[], None]] = None,
+        idle_interval: float = 0.1,
+    ) -> Generator[str, None, None]:
+        """
+        Yield frames read ahead by a background thread.
+
+        The thread runs stream() and hands frames over a bounded queue, so
+        waiting on the socket/port/file overlaps with whatever the caller does
+        per frame (typically decoding). Errors raised by stream() are
+        re-raised here.
+
+        Args:
+            max_pending: Frames buffered before the reader thread waits (default: 1024)
+            on_idle: Optional callback run whenever no frame has arrived for
+                idle_interval seconds, e.g. to flush buffered output
+            idle_interval: Seconds without a frame before on_idle runs (default: 0.1)
+        """
+        frames, stop = self._start_prefetch(max_pending)
+        try:
+            while True:
+                if on_idle is None:
+                    item = frames.get()
+                else:
+                    try:
+                        item = frames.get(timeout=idle_interval)
+                    except queue.Empty:
+                        on_idle()
+                        continue
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def stream_batches(
+        self, max_batch: int = 64, max_pending: int = 1024
+    ) -> Generator[List[str], None, None]:
+        """
+        Yield lists of frames read ahead by a background thread.
+
+        Each list holds every frame that has arrived since the previous one,
+        up to max_batch, so a burst (e.g. a backlog after a stall) is handed
+        over in a few lists instead of frame by frame, ready for bulk
+        processing such as one database insert per batch. Errors raised by
+        stream() are re-raised after the frames that preceded them.
+
+        Args:
+            max_batch: Most frames per list (default: 64)
+            max_pending: Frames buffered before the reader thread waits (default: 1024)
+        """
+        frames, stop = self._start_prefetch(max_pending)
+        try:
+            while True:
+                batch: List[str] = []
+                item = frames.get()
+                while item is not _END_OF_STREAM and not isinstance(item, Exception):
+                    batch.append(item)
+                    if len(batch) >= max_batch:
+                        break
+                    try:
+                        item = frames.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    yield batch
+                if item is _END_OF_STREAM:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+        finally:
+            stop.set()
+
+    def _start_prefetch(self, max_pending: int) -> Tuple[queue.Queue, threading.Event]:
+        """Run stream() on a daemon thread feeding a bounded queue.
+
+        The queue carries frames, then either an exception raised by stream()
+        or the end-of-stream marker. Setting the returned event makes the
+        thread stop and exit.
+        """
+        frames: queue.Queue = queue.Queue(maxsize=max_pending)
+        stop = threading.Event()
+
+        def offer(item: object) -> None:
+            # Give up if the consumer has gone away, so the thread can exit
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def pump() -> None:
+            source = self.stream()
+            try:
+                for frame in source:
+                    offer(frame)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                offer(e)
+            finally:
+                source.close()
+                offer(_END_OF_STREAM)
+
+        threading.Thread(
+            target=pump, name=f"{type(self).__name__}-prefetch", daemon=True
+        ).start()
+        return frames, stop
+
+    def _iter_socket_frames(
+        self,
+        sock: socket.socket,
+        recv_size: int = RECV_SIZE,
+        idle_timeout: Optional[float] = None,
+        stop: Optional[threading.Event] = None,
+        skip_handshakes: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        Yield frames received on a connected socket until it closes or fails.
+
+        This is the receive loop shared by the socket readers: readiness is
+        awaited with a selector, data lands in a reused buffer via recv_into(),
+        and only complete frames are decoded. Read errors go to _report_error().
+
+        Args:
+            sock: Connected socket, blocking or non-blocking
+            recv_size: Bytes requested per recv (default: 64 KiB)
+            idle_timeout: Seconds without data before the stream ends
+                (default: wait forever)
+            stop: Event that ends the stream when set, e.g. by close() from
+                another thread; checked every STOP_POLL_INTERVAL seconds
+            skip_handshakes: Drop our own handshake packets echoed back by the peer
+        """
+        # Frame markers are ASCII, so scan raw bytes and decode only complete
+        # frames; `pos` marks the start of unconsumed data, and the consumed
+        # prefix is only dropped once it is large
+        buffer = bytearray()
+        pos: int = 0
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        # Reused receive area: recv_into() avoids a new bytes object per read
+        recv_view = memoryview(bytearray(recv_size))
+        poll: Optional[float] = STOP_POLL_INTERVAL if stop is not None else None
+        deadline: Optional[float] = (
+            None if idle_timeout is None else time.monotonic() + idle_timeout
+        )
+        try:
+            while stop is None or not stop.is_set():
+                try:
+                    wait = poll
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            logger.info(
+                                "No data received for {}s, closing stream", idle_timeout
+                            )
+                            break
+                        wait = remaining if poll is None else min(poll, remaining)
+                    if not selector.select(wait):
+                        continue
+
+                    received: int = sock.recv_into(recv_view)
+                    if not received:  # Connection closed
+                        break
+                    if deadline is not None:
+                        deadline = time.monotonic() + idle_timeout
+
+                    buffer += recv_view[:received]
+                    spans, pos = scan_frames(buffer, pos)
+                    for start, end in spans:
+                        frame = buffer[start:end].decode("utf-8", errors="ignore")
+                        if not (skip_handshakes and self._is_handshake_packet(frame)):
+                            yield frame
+
+                    if pos > COMPACT_THRESHOLD or pos > len(buffer) // 2:
+                        del buffer[:pos]
+                        pos = 0
+                except BlockingIOError:  # Spurious readiness, wait again
+                    continue
+                except ConnectionResetError:
+                    break
+                except Exception as e:
+                    if stop is not None and stop.is_set():  # Closed under us
+                        break
+                    self._report_error(e)
+                    break
+        finally:
+            selector.close()
+
+    def _is_handshake_packet(self, frame: str) -> bool:
+        """Check if frame is our own handshake packet."""
+        return "1984WITSKIT" in frame and "0111-9999" in frame
+
+    def _report_error(self, error: Exception) -> None:
+        """Pass a read error to on_error, or log it when there is no callback."""
+        if self.on_error:
+            self.on_error(error)
+        else:
+            logger.warning("{} connection error: {}", type(self).__name__, error)
+
     def close(self) -> None:
         """
         Optional cleanup, override if needed (e.g. closing sockets/ports).
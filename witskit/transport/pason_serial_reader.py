@@ -1,9 +1,8 @@
 """Pason-compliant serial transport reader for WITS data with handshaking support."""
 
 import threading
-import time
 from typing import Generator, Optional, Callable
-from .base import BaseTransport
+from .base import COMPACT_THRESHOLD, BaseTransport, scan_frames
 
 try:
     import serial
@@ -27,6 +26,16 @@ class PasonSerialReader(BaseTransport):
     - Handles 1984PASON/EDR headers
     """
 
+    __slots__ = (
+        "port",
+        "baudrate",
+        "serial_kwargs",
+        "serial_conn",
+        "_handshake_thread",
+        "_stop_handshake",
+        "_connection_active",
+    )
+
     # Recommended handshake packet as per Pason standards (Figure 11)
     HANDSHAKE_PACKET = b"&&\r\n0111-9999\r\n!!\r\n"
     HANDSHAKE_INTERVAL = 30  # seconds
@@ -112,42 +121,34 @@ class PasonSerialReader(BaseTransport):
                 self.serial_conn.write(self.handshake_packet)
                 self.serial_conn.flush()
 
-            buffer: str = ""
+            # Scan raw bytes and decode only complete frames; `pos` marks the
+            # start of unconsumed data and the consumed prefix is trimmed in bulk
+            buffer = bytearray()
+            pos: int = 0
             while True:
                 try:
-                    if self.serial_conn.in_waiting > 0:
-                        chunk: bytes = self.serial_conn.read(
-                            self.serial_conn.in_waiting
-                        )
-                        if chunk:
-                            buffer += chunk.decode("utf-8", errors="ignore")
-
-                            # Process complete WITS frames
-                            while "&&" in buffer and "!!" in buffer:
-                                start: int = buffer.index("&&")
-
-                                # Find the matching end marker
-                                end_search_start = start + 2
-                                end_pos = buffer.find("!!", end_search_start)
-                                if end_pos == -1:
-                                    break  # Incomplete frame
-
-                                end: int = end_pos + 2
-                                frame = buffer[start:end]
-
-                                # Handle Pason EDR header filtering
-                                processed_frame = self._process_pason_frame(frame)
-                                if processed_frame:
-                                    yield processed_frame
-
-                                buffer = buffer[end:]
-                    else:
-                        # Small delay to prevent busy waiting
-                        time.sleep(0.01)
+                    # Block (up to the read timeout) for the first byte, then
+                    # drain everything else the driver has buffered
+                    chunk: bytes = self.serial_conn.read(
+                        self.serial_conn.in_waiting or 1
+                    )
+                    if chunk:
+                        buffer += chunk
+                        spans, pos = scan_frames(buffer, pos)
+                        for start, end in spans:
+                            frame = buffer[start:end].decode("utf-8", errors="ignore")
+
+                            # Handle Pason EDR header filtering
+                            processed_frame = self._process_pason_frame(frame)
+                            if processed_frame:
+                                yield processed_frame
+
+                        if pos > COMPACT_THRESHOLD or pos > len(buffer) // 2:
+                            del buffer[:pos]
+                            pos = 0
 
                 except Exception as e:
-                    if self.on_error:
-                        self.on_error(e)
+                    self._report_error(e)
                     break
 
         except Exception as e:
@@ -4,7 +4,7 @@ import socket
 import threading
 import time
 from typing import Generator, Optional, Callable
-from .base import BaseTransport
+from .base import COMPACT_THRESHOLD, RECV_SIZE, BaseTransport, scan_frames
 
 
 class PasonTCPReader(BaseTransport):
@@ -21,6 +21,15 @@ class PasonTCPReader(BaseTransport):
     - Handles 1984PASON/EDR headers
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "socket",
+        "_handshake_thread",
+        "_stop_handshake",
+        "_connection_active",
+    )
+
     # Recommended handshake packet as per Pason standards (Figure 11)
     HANDSHAKE_PACKET = b"&&\r\n0111-9999\r\n!!\r\n"
     HANDSHAKE_INTERVAL = 30  # seconds
@@ -64,7 +73,7 @@ class PasonTCPReader(BaseTransport):
 
             try:
                 if self.socket:
-                    self.socket.send(self.handshake_packet)
+                    self.socket.sendall(self.handshake_packet)
                     # Optional: Log handshake activity
                     # print(f"DEBUG: Sent handshake at {time.strftime('%H:%M:%S')}")
             except Exception as e:
@@ -90,42 +99,38 @@ class PasonTCPReader(BaseTransport):
 
             # Send initial handshake to establish communication
             if self.send_handshake:
-                self.socket.send(self.handshake_packet)
-
-            buffer: str = ""
+                self.socket.sendall(self.handshake_packet)
+
+            # Scan raw bytes and decode only complete frames; `pos` marks the
+            # start of unconsumed data and the consumed prefix is trimmed in bulk
+            buffer = bytearray()
+            pos: int = 0
+            # Reused receive area: recv_into() avoids a new bytes object per read
+            recv_view = memoryview(bytearray(RECV_SIZE))
             while True:
                 try:
-                    chunk: str = self.socket.recv(1024).decode("utf-8", errors="ignore")
-                    if not chunk:  # Connection closed
+                    received: int = self.socket.recv_into(recv_view)
+                    if not received:  # Connection closed
                         break
 
-                    buffer += chunk
-
-                    # Process complete WITS frames
-                    while "&&" in buffer and "!!" in buffer:
-                        start: int = buffer.index("&&")
-
-                        # Find the matching end marker
-                        end_search_start = start + 2
-                        end_pos = buffer.find("!!", end_search_start)
-                        if end_pos == -1:
-                            break  # Incomplete frame
-
-                        end: int = end_pos + 2
-                        frame = buffer[start:end]
+                    buffer += recv_view[:received]
+                    spans, pos = scan_frames(buffer, pos)
+                    for start, end in spans:
+                        frame = buffer[start:end].decode("utf-8", errors="ignore")
 
                         # Handle Pason EDR header filtering
                         processed_frame = self._process_pason_frame(frame)
                         if processed_frame:
                             yield processed_frame
 
-                        buffer = buffer[end:]
+                    if pos > COMPACT_THRESHOLD or pos > len(buffer) // 2:
+                        del buffer[:pos]
+                        pos = 0
 
                 except ConnectionResetError:
                     break
                 except Exception as e:
-                    if self.on_error:
-                        self.on_error(e)
+                    self._report_error(e)
                     break
 
         except Exception as e:
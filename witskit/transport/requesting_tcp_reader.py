@@ -1,8 +1,8 @@
 """Requesting TCP transport reader for streaming WITS data from request/response servers."""
 
 import socket
-from typing import Generator, Optional, Callable
-from .base import BaseTransport
+from typing import Callable, Generator, Optional
+from .base import SOCKET_RCVBUF, BaseTransport, enable_keepalive
 
 
 class RequestingTCPReader(BaseTransport):
@@ -12,6 +12,8 @@ class RequestingTCPReader(BaseTransport):
     to send a request before they start streaming data.
     """
 
+    __slots__ = ("host", "port", "request_data", "timeout", "socket", "_sock_override")
+
     def __init__(
         self,
         host: str,
@@ -21,6 +23,8 @@ class RequestingTCPReader(BaseTransport):
         handshake_interval: int = 30,
         custom_handshake: Optional[bytes] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        timeout: Optional[float] = None,
+        sock: Optional[socket.socket] = None,
     ) -> None:
         """Initialize the requesting TCP reader.
 
@@ -32,40 +36,56 @@ class RequestingTCPReader(BaseTransport):
             handshake_interval: Interval between handshakes in seconds (default: 30)
             custom_handshake: Custom handshake packet (default: uses WitsKit standard)
             on_error: Optional error callback function
+            timeout: Seconds to wait for the connection, and for data before ending
+                the stream (default: wait forever)
+            sock: Already connected socket for the first stream() to use, e.g.
+                from a port probe (default: connect)
         """
         super().__init__(send_handshake, handshake_interval, custom_handshake, on_error)
         self.host: str = host
         self.port: int = port
         # Use handshake packet as default request if none provided
         self.request_data: bytes = request_data or self.handshake_packet
+        self.timeout: Optional[float] = timeout
         self.socket: Optional[socket.socket] = None
+        self._sock_override: Optional[socket.socket] = sock
 
     def stream(self) -> Generator[str, None, None]:
         """Stream WITS frames from TCP connection with initial request."""
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.connect((self.host, self.port))
-
-        # Send initial request to trigger streaming
-        self.socket.send(self.request_data)
-
-        buffer: str = ""
-        while True:
+        # A handed-over socket is used once; later streams reconnect
+        sock, self._sock_override = self._sock_override, None
+        if sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Size the receive buffer before connecting so the window scale
+            # negotiated in the handshake can use it
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+            # Bound the connect and request send by the same timeout; a
+            # socket.timeout (TimeoutError) propagates to the caller
+            sock.settimeout(self.timeout)
             try:
-                chunk: str = self.socket.recv(1024).decode("utf-8", errors="ignore")
-                if not chunk:  # Connection closed
-                    break
+                sock.connect((self.host, self.port))
+            except OSError:
+                sock.close()
+                raise
+        self.socket = sock
+        try:
+            # Send the small request immediately rather than waiting on Nagle/delayed ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Let the OS detect dead peers on long-running streams
+            enable_keepalive(sock)
+
+            # Send initial request to trigger streaming
+            sock.sendall(self.request_data)
 
-                buffer += chunk
-                while "&&" in buffer and "!!" in buffer:
-                    start: int = buffer.index("&&")
-                    end: int = buffer.index("!!") + 2
-                    yield buffer[start:end]
-                    buffer = buffer[end:]
-            except ConnectionResetError:
-                break
-            except Exception as e:
-                print(f"TCP connection error: {e}")
-                break
+            # Wait for readiness with a selector so idle timeouts need no signals
+            sock.setblocking(False)
+        except BaseException:
+            self.close()
+            raise
+        try:
+            yield from self._iter_socket_frames(sock, idle_timeout=self.timeout)
+        finally:
+            self.close()
 
     def close(self) -> None:
         """Close the TCP connection."""
@@ -1,11 +1,21 @@
 from typing import Generator, Optional, Callable
 import threading
-import time
 import serial
-from .base import BaseTransport
+from .base import COMPACT_THRESHOLD, BaseTransport, scan_frames
 
 
 class SerialReader(BaseTransport):
+    __slots__ = (
+        "port",
+        "baudrate",
+        "timeout",
+        "serial_kwargs",
+        "serial",
+        "_handshake_thread",
+        "_stop_handshake",
+        "_connection_active",
+    )
+
     def __init__(
         self,
         port: str,
@@ -14,6 +24,7 @@ class SerialReader(BaseTransport):
         handshake_interval: int = 30,
         custom_handshake: Optional[bytes] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        timeout: float = 1.0,
         **serial_kwargs,
     ) -> None:
         """Initialize serial reader with handshaking support.
@@ -25,11 +36,13 @@ class SerialReader(BaseTransport):
             handshake_interval: Interval between handshakes in seconds (default: 30)
             custom_handshake: Custom handshake packet (default: uses WitsKit standard)
             on_error: Optional error callback function
+            timeout: Longest a read waits for the first byte, in seconds (default: 1)
             **serial_kwargs: Additional serial port configuration
         """
         super().__init__(send_handshake, handshake_interval, custom_handshake, on_error)
         self.port = port
         self.baudrate = baudrate
+        self.timeout = timeout
         self.serial_kwargs = serial_kwargs
         self.serial: Optional[serial.Serial] = None
         self._handshake_thread: Optional[threading.Thread] = None
@@ -55,8 +68,13 @@ class SerialReader(BaseTransport):
         """Stream WITS frames from serial connection with automatic handshaking."""
         try:
             self.serial = serial.Serial(
-                port=self.port, baudrate=self.baudrate, timeout=1, **self.serial_kwargs
+                port=self.port,
+                baudrate=self.baudrate,
+                timeout=self.timeout,
+                **self.serial_kwargs,
             )
+            # Drop stale bytes queued by the driver before we connected
+            self.serial.reset_input_buffer()
             self._connection_active.set()
 
             # Start handshake thread if enabled
@@ -71,33 +89,29 @@ class SerialReader(BaseTransport):
                 self.serial.write(self.handshake_packet)
                 self.serial.flush()
 
-            buffer: str = ""
+            # Scan raw bytes and decode only complete frames
+            buffer = bytearray()
+            pos: int = 0
             while True:
-                if self.serial.in_waiting > 0:
-                    chunk: bytes = self.serial.read(self.serial.in_waiting)
-                    if chunk:
-                        buffer += chunk.decode("utf-8", errors="ignore")
-
-                        while "&&" in buffer and "!!" in buffer:
-                            start: int = buffer.index("&&")
-                            end: int = buffer.index("!!") + 2
-                            frame = buffer[start:end]
-
-                            # Filter out our own handshake packets
-                            if not self._is_handshake_packet(frame):
-                                yield frame
-
-                            buffer = buffer[end:]
-                else:
-                    # Small delay to prevent busy waiting
-                    time.sleep(0.01)
+                # Block (up to timeout) for the first byte, then drain
+                # everything else the driver has buffered in the same call
+                chunk: bytes = self.serial.read(self.serial.in_waiting or 1)
+                if chunk:
+                    buffer += chunk
+                    spans, pos = scan_frames(buffer, pos)
+                    for start, end in spans:
+                        frame = buffer[start:end].decode("utf-8", errors="ignore")
+
+                        # Filter out our own handshake packets
+                        if not self._is_handshake_packet(frame):
+                            yield frame
+
+                    if pos > COMPACT_THRESHOLD or pos > len(buffer) // 2:
+                        del buffer[:pos]
+                        pos = 0
         finally:
             self._cleanup()
 
-    def _is_handshake_packet(self, frame: str) -> bool:
-        """Check if frame is our own handshake packet."""
-        return "1984WITSKIT" in frame and "0111-9999" in frame
-
     def _cleanup(self) -> None:
         """Clean up resources."""
         self._connection_active.clear()
@@ -4,10 +4,32 @@ import socket
 import threading
 import time
 from typing import Generator, Optional, Callable
-from .base import BaseTransport
+from .base import (
+    RECV_SIZE,
+    SOCKET_RCVBUF,
+    BaseTransport,
+    enable_keepalive,
+)
+
+# First reconnect delay in seconds; doubles after each failed attempt
+INITIAL_BACKOFF = 1.0
 
 
 class TCPReader(BaseTransport):
+    __slots__ = (
+        "host",
+        "port",
+        "recv_size",
+        "rcvbuf",
+        "reconnect",
+        "max_backoff",
+        "socket",
+        "_stop",
+        "_handshake_thread",
+        "_stop_handshake",
+        "_connection_active",
+    )
+
     def __init__(
         self,
         host: str,
@@ -16,6 +38,10 @@ class TCPReader(BaseTransport):
         handshake_interval: int = 30,
         custom_handshake: Optional[bytes] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        recv_size: int = RECV_SIZE,
+        rcvbuf: int = SOCKET_RCVBUF,
+        reconnect: bool = False,
+        max_backoff: float = 30.0,
     ) -> None:
         """Initialize TCP reader with handshaking support.
 
@@ -26,11 +52,21 @@ class TCPReader(BaseTransport):
             handshake_interval: Interval between handshakes in seconds (default: 30)
             custom_handshake: Custom handshake packet (default: uses WitsKit standard)
             on_error: Optional error callback function
+            recv_size: Bytes requested per recv (default: 64 KiB)
+            rcvbuf: Kernel receive buffer size requested (default: 2 MiB)
+            reconnect: Reconnect with exponential backoff when the connection
+                fails or drops, until close() is called (default: False)
+            max_backoff: Longest wait between reconnect attempts in seconds (default: 30)
         """
         super().__init__(send_handshake, handshake_interval, custom_handshake, on_error)
         self.host: str = host
         self.port: int = port
+        self.recv_size: int = recv_size
+        self.rcvbuf: int = rcvbuf
+        self.reconnect: bool = reconnect
+        self.max_backoff: float = max_backoff
         self.socket: Optional[socket.socket] = None
+        self._stop: threading.Event = threading.Event()
         self._handshake_thread: Optional[threading.Thread] = None
         self._stop_handshake: threading.Event = threading.Event()
         self._connection_active: threading.Event = threading.Event()
@@ -43,7 +79,7 @@ class TCPReader(BaseTransport):
 
             try:
                 if self.socket:
-                    self.socket.send(self.handshake_packet)
+                    self.socket.sendall(self.handshake_packet)
             except Exception as e:
                 if self.on_error:
                     self.on_error(e)
@@ -51,12 +87,10 @@ class TCPReader(BaseTransport):
 
     def stream(self) -> Generator[str, None, None]:
         """Stream WITS frames from TCP connection with automatic handshaking."""
+        self._stop.clear()
+        backoff: float = INITIAL_BACKOFF
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.host, self.port))
-            self._connection_active.set()
-
-            # Start handshake thread if enabled
+            # Start handshake thread if enabled; it idles while disconnected
             if self.send_handshake:
                 self._stop_handshake.clear()
                 self._handshake_thread = threading.Thread(
@@ -64,41 +98,54 @@ class TCPReader(BaseTransport):
                 )
                 self._handshake_thread.start()
 
-                # Send initial handshake
-                self.socket.send(self.handshake_packet)
-
-            buffer: str = ""
-            while True:
+            while not self._stop.is_set():
                 try:
-                    chunk: str = self.socket.recv(1024).decode("utf-8", errors="ignore")
-                    if not chunk:  # Connection closed
-                        break
-
-                    buffer += chunk
-                    while "&&" in buffer and "!!" in buffer:
-                        start: int = buffer.index("&&")
-                        end: int = buffer.index("!!") + 2
-                        frame = buffer[start:end]
-
-                        # Filter out our own handshake packets
-                        if not self._is_handshake_packet(frame):
-                            yield frame
-
-                        buffer = buffer[end:]
-                except ConnectionResetError:
-                    break
-                except Exception as e:
-                    if self.on_error:
-                        self.on_error(e)
-                    else:
-                        print(f"TCP connection error: {e}")
+                    self.socket = self._connect()
+                    self._connection_active.set()
+
+                    # Send initial handshake
+                    if self.send_handshake:
+                        self.socket.sendall(self.handshake_packet)
+
+                    for frame in self._iter_socket_frames(
+                        self.socket,
+                        self.recv_size,
+                        stop=self._stop,
+                        skip_handshakes=True,
+                    ):
+                        backoff = INITIAL_BACKOFF
+                        yield frame
+                except OSError as e:
+                    if not self.reconnect or self._stop.is_set():
+                        raise
+                    self._report_error(e)
+                finally:
+                    self._connection_active.clear()
+                    self._close_socket()
+
+                if not self.reconnect or self._stop.wait(backoff):
                     break
+                backoff = min(backoff * 2, self.max_backoff)
         finally:
             self._cleanup()
 
-    def _is_handshake_packet(self, frame: str) -> bool:
-        """Check if frame is our own handshake packet."""
-        return "1984WITSKIT" in frame and "0111-9999" in frame
+    def _connect(self) -> socket.socket:
+        """Open a tuned TCP connection to the configured host."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # Size the receive buffer before connecting so the window scale
+            # negotiated in the handshake can use it
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+            sock.connect((self.host, self.port))
+            # Small frames and handshakes go out immediately instead of
+            # waiting on Nagle/delayed ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Notice a dead peer within a minute rather than hours
+            enable_keepalive(sock)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -109,7 +156,10 @@ class TCPReader(BaseTransport):
             self._stop_handshake.set()
             self._handshake_thread.join(timeout=2)
 
-        # Close socket
+        self._close_socket()
+
+    def _close_socket(self) -> None:
+        """Close the current connection, if any."""
         if self.socket:
             try:
                 self.socket.close()
@@ -118,5 +168,10 @@ class TCPReader(BaseTransport):
             self.socket = None
 
     def close(self) -> None:
-        """Close the TCP connection and stop handshaking."""
+        """Close the TCP connection and stop handshaking.
+
+        Safe to call from another thread; a running stream() returns within
+        STOP_POLL_INTERVAL seconds.
+        """
+        self._stop.set()
         self._cleanup()